@@ -5,25 +5,33 @@ Extracted from wizard.py to improve code organization and testability.
 """
 
 import json
-import os
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 def load_ui_config() -> Dict[str, Any]:
     """Load UI configuration like API keys from ui_config.json"""
     print(f"DEBUG [load_ui_config]: CALLED - Starting UI config load from ui_config.json")
     try:
-        if os.path.exists('ui_config.json'):
+        # Open directly rather than checking existence first (one filesystem call)
+        with open('ui_config.json', 'rb') as f:
             print(f"DEBUG [load_ui_config]: File exists, reading...")
-            with open('ui_config.json', 'r') as f:
-                config = json.load(f)
-            print(f"DEBUG [load_ui_config]: Successfully loaded config with {len(config)} keys")
-            print(f"DEBUG [load_ui_config]: enable_ai_analysis = {config.get('enable_ai_analysis', 'MISSING')}")
-            print(f"DEBUG [load_ui_config]: gemini_api_key = {config.get('gemini_api_key', 'MISSING')[:10] if config.get('gemini_api_key') else 'EMPTY'}...")
-            print(f"DEBUG [load_ui_config]: gemini_model = {config.get('gemini_model', 'MISSING')}")
-            return config
-        else:
-            print(f"DEBUG [load_ui_config]: ui_config.json does not exist")
+            data = f.read()
+        config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        print(f"DEBUG [load_ui_config]: Successfully loaded config with {len(config)} keys")
+        print(f"DEBUG [load_ui_config]: enable_ai_analysis = {config.get('enable_ai_analysis', 'MISSING')}")
+        print(f"DEBUG [load_ui_config]: gemini_api_key = {config.get('gemini_api_key', 'MISSING')[:10] if config.get('gemini_api_key') else 'EMPTY'}...")
+        print(f"DEBUG [load_ui_config]: gemini_model = {config.get('gemini_model', 'MISSING')}")
+        return config
+    except FileNotFoundError:
+        print(f"DEBUG [load_ui_config]: ui_config.json does not exist")
     except Exception as e:
         print(f"ERROR [load_ui_config]: Could not load ui_config.json: {e}")
     default_config = {}
@@ -39,27 +47,44 @@ def save_ui_config(config: Dict[str, Any]) -> None:
     print(f"DEBUG [save_ui_config]: gemini_api_key = {config.get('gemini_api_key', 'MISSING')[:10] if config.get('gemini_api_key') else 'EMPTY'}...")
     print(f"DEBUG [save_ui_config]: gemini_model = {config.get('gemini_model', 'MISSING')}")
     try:
-        with open('ui_config.json', 'w') as f:
-            json.dump(config, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open('ui_config.json', 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open('ui_config.json', 'w') as f:
+                json.dump(config, f, indent=2)
         print(f"DEBUG [save_ui_config]: Successfully saved to ui_config.json")
     except Exception as e:
         print(f"ERROR [save_ui_config]: Could not save ui_config.json: {e}")
 
 
+@dataclass(frozen=True, slots=True)
+class WizardStep:
+    """A single wizard step: routing id plus display text"""
+    id: str
+    title: str
+    description: str
+
+
 # Wizard step configuration
-WIZARD_STEPS = [
-    {"id": "welcome", "title": "🏠 Welcome", "description": "Getting started with your retirement plan"},
-    {"id": "basics", "title": "💰 Financial Basics", "description": "Current situation and spending needs"},
-    {"id": "allocation", "title": "📊 Asset Allocation", "description": "Portfolio mix and risk tolerance"},
-    {"id": "market", "title": "📈 Market Expectations", "description": "Return assumptions and volatility"},
-    {"id": "taxes", "title": "🏛️ Tax Planning", "description": "State taxes and brackets"},
-    {"id": "social_security", "title": "🏛️ Social Security", "description": "Benefit planning and scenarios"},
-    {"id": "guardrails", "title": "⚖️ Spending Guardrails", "description": "Dynamic spending adjustments"},
-    {"id": "cash_flows", "title": "💸 Income & Expenses", "description": "Additional cash flows over time"},
-    {"id": "ai_setup", "title": "🤖 AI Analysis", "description": "Optional AI-powered insights"},
-    {"id": "advanced", "title": "⚙️ Advanced Options", "description": "Market scenarios and fine-tuning"},
-    {"id": "review", "title": "📋 Review & Generate", "description": "Final review and JSON export"}
-]
+WIZARD_STEPS = (
+    WizardStep("welcome", "🏠 Welcome", "Getting started with your retirement plan"),
+    WizardStep("basics", "💰 Financial Basics", "Current situation and spending needs"),
+    WizardStep("allocation", "📊 Asset Allocation", "Portfolio mix and risk tolerance"),
+    WizardStep("market", "📈 Market Expectations", "Return assumptions and volatility"),
+    WizardStep("taxes", "🏛️ Tax Planning", "State taxes and brackets"),
+    WizardStep("social_security", "🏛️ Social Security", "Benefit planning and scenarios"),
+    WizardStep("guardrails", "⚖️ Spending Guardrails", "Dynamic spending adjustments"),
+    WizardStep("cash_flows", "💸 Income & Expenses", "Additional cash flows over time"),
+    WizardStep("ai_setup", "🤖 AI Analysis", "Optional AI-powered insights"),
+    WizardStep("advanced", "⚙️ Advanced Options", "Market scenarios and fine-tuning"),
+    WizardStep("review", "📋 Review & Generate", "Final review and JSON export"),
+)
+
+# Step id -> position in WIZARD_STEPS
+WIZARD_STEP_INDEX: Mapping[str, int] = MappingProxyType(
+    {step.id: index for index, step in enumerate(WIZARD_STEPS)}
+)
 
 
 def get_default_wizard_params() -> Dict[str, Any]:
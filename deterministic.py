@@ -3,6 +3,7 @@ Deterministic retirement projection using expected returns (no randomness).
 Provides baseline scenario for comparison with Monte Carlo results.
 """
 import numpy as np
+from collections import OrderedDict
 from typing import Dict, List
 from dataclasses import dataclass
 from simulation import SimulationParams
@@ -20,6 +21,12 @@ class DeterministicResults:
     year_by_year_details: Dict
 
 
+# Recent projections keyed on the params repr, so Streamlit reruns with
+# unchanged inputs skip the year-by-year loop
+_PROJECTION_CACHE_SIZE = 8
+_projection_cache: "OrderedDict[str, DeterministicResults]" = OrderedDict()
+
+
 class DeterministicProjector:
     """Deterministic retirement projection with expected returns"""
     
@@ -334,6 +341,26 @@ class DeterministicProjector:
             year_by_year_details=details
         )
 
+    def run_cached(self) -> DeterministicResults:
+        """
+        Run deterministic projection, reusing the result for identical params.
+
+        SimulationParams holds mutable lists, so the cache key is its repr
+        (every field value) rather than a hash of the object. The cached
+        DeterministicResults is shared between callers and must not be mutated.
+        """
+        key = repr(self.params)
+        cached = _projection_cache.get(key)
+        if cached is not None:
+            _projection_cache.move_to_end(key)
+            return cached
+
+        results = self.run_projection()
+        _projection_cache[key] = results
+        if len(_projection_cache) > _PROJECTION_CACHE_SIZE:
+            _projection_cache.popitem(last=False)
+        return results
+
 
 def convert_to_nominal(real_values: np.ndarray, 
                       start_year: int, 
@@ -3,16 +3,62 @@ IO utilities for saving/loading parameters and exporting simulation results.
 Handles JSON serialization of parameters and CSV exports of results.
 """
 import json
-import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, TextIO, Tuple, Union
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import fields
 import io
+import math
+from functools import cache
+from operator import attrgetter
 from datetime import datetime
+from types import MappingProxyType
 
 from simulation import SimulationParams, SimulationResults
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Shared read-only stand-in for missing wizard JSON sections
+_EMPTY_SECTION = MappingProxyType({})
+
+
+def loads_json(data):
+    """Parse JSON text or bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@cache
+def _cached_loads_json():
+    """loads_json wrapped in st.cache_data, built on first use so importing io_utils doesn't need streamlit"""
+    import streamlit as st
+    return st.cache_data(show_spinner=False)(loads_json)
+
+
+def parse_uploaded_json(file_bytes: bytes) -> Dict[str, Any]:
+    """Parse an uploaded JSON file, cached on its contents so reruns skip the parse"""
+    return _cached_loads_json()(file_bytes)
+
+
+def _json_dumps_bytes(obj: Any, default=None) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson (which also handles NumPy types) when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, default=default).encode('utf-8')
+
+
+def _json_dumps(obj: Any, default=None) -> str:
+    """Serialize to an indented JSON string (see _json_dumps_bytes)"""
+    if ORJSON_AVAILABLE:
+        return _json_dumps_bytes(obj, default).decode('utf-8')
+    return json.dumps(obj, indent=2, default=default)
+
 
 def _safe_numeric_convert(value: Any, default: float) -> float:
     """Safely convert a value to a numeric type, using default if invalid"""
@@ -30,6 +76,15 @@ def _safe_ss_benefit_check(value: Any) -> bool:
         return False
 
 
+# SimulationParams field names and a getter for all of them, resolved once at import
+_PARAM_FIELD_NAMES = tuple(field.name for field in fields(SimulationParams))
+_get_param_values = attrgetter(*_PARAM_FIELD_NAMES)
+
+# The only mutable SimulationParams fields: lists of flat stream dicts, and
+# tax_brackets, a list of immutable (threshold, rate) tuples
+_PARAM_STREAM_FIELDS = ('expense_streams', 'income_streams')
+
+
 def params_to_dict(params: SimulationParams) -> Dict[str, Any]:
     """
     Convert SimulationParams to dictionary for JSON serialization.
@@ -40,7 +95,16 @@ def params_to_dict(params: SimulationParams) -> Dict[str, Any]:
     Returns:
         Dictionary representation
     """
-    return asdict(params)
+    # Copy only the known-mutable fields, one level deep; asdict would
+    # deepcopy every field recursively
+    param_dict = dict(zip(_PARAM_FIELD_NAMES, _get_param_values(params)))
+    for name in _PARAM_STREAM_FIELDS:
+        streams = param_dict[name]
+        if streams is not None:
+            param_dict[name] = [dict(stream) for stream in streams]
+    if param_dict['tax_brackets'] is not None:
+        param_dict['tax_brackets'] = list(param_dict['tax_brackets'])
+    return param_dict
 
 
 def dict_to_params(param_dict: Dict[str, Any]) -> SimulationParams:
@@ -71,7 +135,7 @@ def dict_to_params(param_dict: Dict[str, Any]) -> SimulationParams:
     # Handle tax_brackets which might be None or list of tuples
     if 'tax_brackets' in filtered_dict and filtered_dict['tax_brackets'] is not None:
         # Convert list of lists back to list of tuples
-        filtered_dict['tax_brackets'] = [tuple(bracket) for bracket in filtered_dict['tax_brackets']]
+        filtered_dict['tax_brackets'] = list(map(tuple, filtered_dict['tax_brackets']))
 
     return SimulationParams(**filtered_dict)
 
@@ -84,14 +148,9 @@ def save_parameters_json(params: SimulationParams, filepath: str) -> None:
         params: SimulationParams object to save
         filepath: Path to save JSON file
     """
-    param_dict = params_to_dict(params)
-    
-    # Convert tuples to lists for JSON serialization
-    if param_dict.get('tax_brackets'):
-        param_dict['tax_brackets'] = [list(bracket) for bracket in param_dict['tax_brackets']]
-    
-    with open(filepath, 'w') as f:
-        json.dump(param_dict, f, indent=2)
+    # Tax bracket tuples serialize as JSON arrays directly
+    with open(filepath, 'wb') as f:
+        f.write(_json_dumps_bytes(params_to_dict(params)))
 
 
 def load_parameters_json(filepath: str) -> SimulationParams:
@@ -104,8 +163,8 @@ def load_parameters_json(filepath: str) -> SimulationParams:
     Returns:
         SimulationParams object
     """
-    with open(filepath, 'r') as f:
-        param_dict = json.load(f)
+    with open(filepath, 'rb') as f:
+        param_dict = loads_json(f.read())
     
     return dict_to_params(param_dict)
 
@@ -120,26 +179,21 @@ def create_parameters_download_json(params: SimulationParams) -> str:
     Returns:
         JSON string
     """
-    param_dict = params_to_dict(params)
-    
-    # Convert tuples to lists for JSON serialization
-    if param_dict.get('tax_brackets'):
-        param_dict['tax_brackets'] = [list(bracket) for bracket in param_dict['tax_brackets']]
-    
-    return json.dumps(param_dict, indent=2)
+    # Tax bracket tuples serialize as JSON arrays directly
+    return _json_dumps(params_to_dict(params))
 
 
-def parse_parameters_upload_json(json_string: str) -> SimulationParams:
+def parse_parameters_upload_json(json_string: Union[str, bytes, Dict[str, Any]]) -> SimulationParams:
     """
     Parse uploaded JSON string to SimulationParams.
 
     Args:
-        json_string: JSON string with parameters
+        json_string: JSON string with parameters, or an already-parsed dict
 
     Returns:
         SimulationParams object
     """
-    param_dict = json.loads(json_string)
+    param_dict = json_string if isinstance(json_string, dict) else loads_json(json_string)
 
     # Check if this is wizard-generated JSON (has nested structure)
     if 'basic_params' in param_dict and 'allocation' in param_dict:
@@ -330,14 +384,21 @@ def convert_wizard_json_to_simulation_params(wizard_json: Dict[str, Any]) -> Dic
     Returns:
         Flat parameter dictionary compatible with SimulationParams
     """
-    basic = wizard_json.get('basic_params', {})
-    allocation = wizard_json.get('allocation', {})
-    market = wizard_json.get('market_assumptions', {})
-    taxes = wizard_json.get('taxes', {})
-    ss = wizard_json.get('social_security', {})
-    guardrails = wizard_json.get('guardrails', {})
-    simulation = wizard_json.get('simulation', {})
-    cash_flows = wizard_json.get('cash_flows', {})
+    basic = wizard_json.get('basic_params', _EMPTY_SECTION)
+    allocation = wizard_json.get('allocation', _EMPTY_SECTION)
+    market = wizard_json.get('market_assumptions', _EMPTY_SECTION)
+    taxes = wizard_json.get('taxes', _EMPTY_SECTION)
+    ss = wizard_json.get('social_security', _EMPTY_SECTION)
+    guardrails = wizard_json.get('guardrails', _EMPTY_SECTION)
+    simulation = wizard_json.get('simulation', _EMPTY_SECTION)
+    cash_flows = wizard_json.get('cash_flows', _EMPTY_SECTION)
+
+    # Fixed spending seeds both the initial base and the fixed annual amount
+    fixed_spending = _get_wizard_fixed_spending(basic)
+
+    # One pass over expense streams splits off the inheritance entry
+    expense_streams, inheritance = _convert_wizard_expense_streams(
+        cash_flows.get('expense_streams', []))
 
     # Core parameters
     params = {
@@ -404,11 +465,11 @@ def convert_wizard_json_to_simulation_params(wizard_json: Dict[str, Any]) -> Dic
         'random_seed': simulation.get('random_seed', None),
 
         # Initial spending configuration
-        'initial_base_spending': _get_wizard_initial_spending(basic),
-        'fixed_annual_spending': _get_wizard_fixed_spending(basic),
+        'initial_base_spending': fixed_spending,
+        'fixed_annual_spending': fixed_spending,
 
         # Handle cash flows - convert from wizard structure
-        'expense_streams': _convert_wizard_expense_streams(cash_flows.get('expense_streams', [])),
+        'expense_streams': expense_streams,
     }
 
     # Handle other income streams - convert to individual parameters
@@ -424,19 +485,17 @@ def convert_wizard_json_to_simulation_params(wizard_json: Dict[str, Any]) -> Dic
         params['other_income_start_year'] = first_income.get('start_year', 2025)
         params['other_income_years'] = first_income.get('duration', 0)
 
-    # Handle inheritance - look for inheritance in expense streams
+    # Handle inheritance - taken from the first inheritance expense stream
     params['inherit_amount'] = 0
     params['inherit_year'] = 2025
 
-    for expense in cash_flows.get('expense_streams', []):
-        if 'inheritance' in expense.get('description', '').lower():
-            # Inheritance is negative expense
-            params['inherit_amount'] = abs(expense.get('amount', 0))
-            params['inherit_year'] = expense.get('start_year', 2025)
-            break
+    if inheritance is not None:
+        # Inheritance is negative expense
+        params['inherit_amount'] = abs(inheritance.get('amount', 0))
+        params['inherit_year'] = inheritance.get('start_year', 2025)
 
     # College and real estate - extract from advanced options if present
-    advanced = wizard_json.get('advanced_options', {})
+    advanced = wizard_json.get('advanced_options', _EMPTY_SECTION)
     params['college_enabled'] = advanced.get('college_enabled', True)
     params['college_base_amount'] = advanced.get('college_amount', 100_000)
     params['college_start_year'] = advanced.get('college_start_year', 2032)
@@ -466,7 +525,9 @@ def convert_wizard_json_to_simulation_params(wizard_json: Dict[str, Any]) -> Dic
     return params
 
 
-def _convert_wizard_expense_streams(wizard_expense_streams: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _convert_wizard_expense_streams(
+        wizard_expense_streams: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
     """
     Convert wizard expense stream format to simulation format.
 
@@ -474,13 +535,17 @@ def _convert_wizard_expense_streams(wizard_expense_streams: List[Dict[str, Any]]
         wizard_expense_streams: List of expense streams from wizard
 
     Returns:
-        List of expense streams compatible with SimulationParams
+        (expense streams compatible with SimulationParams,
+         first inheritance entry or None)
     """
     converted_streams = []
+    inheritance = None
 
     for stream in wizard_expense_streams:
-        # Skip inheritance entries (handled separately)
+        # Inheritance entries are not expenses; the first one is returned separately
         if 'inheritance' in stream.get('description', '').lower():
+            if inheritance is None:
+                inheritance = stream
             continue
 
         converted_stream = {
@@ -491,30 +556,81 @@ def _convert_wizard_expense_streams(wizard_expense_streams: List[Dict[str, Any]]
         }
         converted_streams.append(converted_stream)
 
-    return converted_streams
+    return converted_streams, inheritance
 
 
-def export_terminal_wealth_csv(terminal_wealth: np.ndarray) -> str:
+# Rows formatted per block by _write_numeric_csv; bounds the per-cell strings
+# alive at once while keeping the number of buf.write calls small
+_CSV_CHUNK_ROWS = 8192
+
+
+def _csv_column_text(values: np.ndarray) -> List[str]:
+    """
+    Format a numeric column the way DataFrame.to_csv does.
+    
+    Args:
+        values: 1-D integer or float array
+        
+    Returns:
+        Cell strings: shortest round-trip repr for floats, blanks for NaN
+    """
+    text = values.astype(str)
+    if values.dtype.kind == 'f':
+        text[np.isnan(values)] = ''
+    return text.tolist()
+
+
+def _numeric_csv_chunks(header: str, columns: Tuple[np.ndarray, ...]) -> Iterator[str]:
+    """Yield the header line, then CSV text for _CSV_CHUNK_ROWS rows at a time"""
+    yield header + '\n'
+    for start in range(0, len(columns[0]), _CSV_CHUNK_ROWS):
+        rows = zip(*(_csv_column_text(column[start:start + _CSV_CHUNK_ROWS]) for column in columns))
+        yield '\n'.join(map(','.join, rows)) + '\n'
+
+
+def _write_numeric_csv(header: str, columns: Tuple[np.ndarray, ...],
+                       buf: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Write equal-length numeric columns as CSV text matching DataFrame.to_csv.
+    
+    Args:
+        header: Header line without the trailing newline
+        columns: Column arrays in output order
+        buf: Optional text stream to write into instead of returning a string
+        
+    Returns:
+        CSV string, or None when written to buf
+    """
+    chunks = _numeric_csv_chunks(header, columns)
+    if buf is None:
+        return ''.join(chunks)
+    # Stream block by block so a ZIP entry never holds the whole CSV as text
+    buf.writelines(chunks)
+    return None
+
+
+def export_terminal_wealth_csv(terminal_wealth: np.ndarray,
+                               buf: Optional[TextIO] = None) -> Optional[str]:
     """
     Export terminal wealth results to CSV string.
     
     Args:
         terminal_wealth: Array of terminal wealth values
+        buf: Optional text stream to write into instead of returning a string
         
     Returns:
-        CSV string
+        CSV string, or None when written to buf
     """
-    df = pd.DataFrame({
-        'simulation': range(1, len(terminal_wealth) + 1),
-        'terminal_wealth': terminal_wealth
-    })
-    
-    return df.to_csv(index=False)
+    terminal_wealth = np.asarray(terminal_wealth)
+    sim_index = np.arange(1, terminal_wealth.shape[0] + 1, dtype=np.int64)
+    # Plain numeric columns: format with NumPy directly rather than via a DataFrame
+    return _write_numeric_csv('simulation,terminal_wealth', (sim_index, terminal_wealth), buf)
 
 
 def export_percentile_bands_csv(years: np.ndarray, 
                                percentiles: Dict[str, np.ndarray],
-                               currency_format: str = "real") -> str:
+                               currency_format: str = "real",
+                               buf: Optional[TextIO] = None) -> Optional[str]:
     """
     Export wealth percentile bands to CSV string.
     
@@ -522,51 +638,64 @@ def export_percentile_bands_csv(years: np.ndarray,
         years: Array of years
         percentiles: Dictionary with 'p10', 'p50', 'p90' arrays
         currency_format: "real" or "nominal" for column naming
+        buf: Optional text stream to write into instead of returning a string
         
     Returns:
-        CSV string
+        CSV string, or None when written to buf
     """
-    df = pd.DataFrame({
-        'year': years,
-        f'p10_wealth_{currency_format}': percentiles['p10'],
-        f'p50_wealth_{currency_format}': percentiles['p50'],
-        f'p90_wealth_{currency_format}': percentiles['p90']
-    })
+    columns = (years, percentiles['p10'], percentiles['p50'], percentiles['p90'])
+    if len({len(column) for column in columns}) != 1:
+        raise ValueError("All arrays must be of the same length")
     
-    return df.to_csv(index=False)
+    names = ['year'] + [f'{p}_wealth_{currency_format}' for p in ('p10', 'p50', 'p90')]
+    header = ','.join(names)
+    
+    return _write_numeric_csv(header, tuple(np.asarray(column) for column in columns), buf)
+
+
+# Year-by-year dollar columns, suffixed with the currency format on export
+_CURRENCY_COLUMNS = (
+    'start_assets', 'base_spending', 'adjusted_base_spending',
+    'college_topup', 'one_times', 're_income', 'other_income', 'ss_income',
+    'taxable_income', 'taxes', 'net_need', 'gross_withdrawal',
+    'growth', 'inheritance', 'end_assets'
+)
+_CURRENCY_RENAME_MAPS = {
+    currency_format: {col: f'{col}_{currency_format}' for col in _CURRENCY_COLUMNS}
+    for currency_format in ('real', 'nominal')
+}
 
 
 def export_year_by_year_csv(details: Dict[str, List], 
-                           currency_format: str = "real") -> str:
+                           currency_format: str = "real",
+                           buf: Optional[TextIO] = None) -> Optional[str]:
     """
     Export year-by-year details table to CSV string.
     
     Args:
         details: Dictionary with year-by-year details
         currency_format: "real" or "nominal" for column naming
+        buf: Optional text stream to write into instead of returning a string
         
     Returns:
-        CSV string
+        CSV string, or None when written to buf
     """
-    # Create DataFrame from details dictionary
-    df = pd.DataFrame(details)
-    
     # Rename columns to include currency format
-    currency_columns = [
-        'start_assets', 'base_spending', 'adjusted_base_spending',
-        'college_topup', 'one_times', 're_income', 'other_income', 'ss_income',
-        'taxable_income', 'taxes', 'net_need', 'gross_withdrawal',
-        'growth', 'inheritance', 'end_assets'
-    ]
+    rename_map = _CURRENCY_RENAME_MAPS.get(currency_format)
+    if rename_map is None:
+        rename_map = {col: f'{col}_{currency_format}' for col in _CURRENCY_COLUMNS}
     
-    rename_dict = {}
-    for col in currency_columns:
-        if col in df.columns:
-            rename_dict[col] = f'{col}_{currency_format}'
+    # Columns are stored under their final names directly, so there is no
+    # rename pass; the DataFrame infers dtypes exactly as before so booleans,
+    # labels and whole-number floats keep their DataFrame.to_csv formatting
+    columns = {rename_map.get(col, col): values for col, values in details.items()}
     
-    df = df.rename(columns=rename_dict)
+    # pandas is only needed for this export; importing it lazily keeps it out
+    # of the import path for callers that only load/save parameters
+    import pandas as pd
+    df = pd.DataFrame(columns, copy=False)
     
-    return df.to_csv(index=False)
+    return df.to_csv(buf, index=False)
 
 
 def create_summary_report(params: SimulationParams,
@@ -583,41 +712,60 @@ def create_summary_report(params: SimulationParams,
     Returns:
         Dictionary with summary information
     """
+    # Sort once: min/max come from the ends and every threshold probability
+    # is a binary search instead of a full pass over terminal_wealth
+    tw_sorted = np.sort(results.terminal_wealth)
+    n_sims = tw_sorted.size
+    
+    p10, p25, p50, p75, p90 = np.percentile(tw_sorted, [10, 25, 50, 75, 90]).tolist()
+    
+    # Population std from the already-computed mean (np.std would recompute it)
+    mean = tw_sorted.mean()
+    deviations = tw_sorted - mean
+    std = np.sqrt(np.dot(deviations, deviations) / tw_sorted.size)
+
+    # Every statistic is cast to a Python scalar so the report serializes as
+    # plain JSON numbers without a per-value fallback
     terminal_stats = {
-        'mean': np.mean(results.terminal_wealth),
-        'median': np.median(results.terminal_wealth),
-        'std': np.std(results.terminal_wealth),
-        'p10': np.percentile(results.terminal_wealth, 10),
-        'p25': np.percentile(results.terminal_wealth, 25),
-        'p75': np.percentile(results.terminal_wealth, 75),
-        'p90': np.percentile(results.terminal_wealth, 90),
-        'min': np.min(results.terminal_wealth),
-        'max': np.max(results.terminal_wealth)
+        'mean': float(mean),
+        'median': p50,
+        'std': float(std),
+        'p10': p10,
+        'p25': p25,
+        'p75': p75,
+        'p90': p90,
+        'min': float(tw_sorted[0]),
+        'max': float(tw_sorted[-1])
     }
-    
-    # Probability thresholds
+
+    # Probability thresholds ('right' counts <= 0, 'left' counts < threshold)
+    at_or_below_zero = np.searchsorted(tw_sorted, 0, side='right')
+    below_1m, below_5m, below_10m, below_15m = np.searchsorted(
+        tw_sorted, [1_000_000, 5_000_000, 10_000_000, 15_000_000], side='left')
     prob_thresholds = {
-        'prob_below_0': np.mean(results.terminal_wealth <= 0),
-        'prob_below_1m': np.mean(results.terminal_wealth < 1_000_000),
-        'prob_below_5m': np.mean(results.terminal_wealth < 5_000_000),
-        'prob_below_10m': np.mean(results.terminal_wealth < 10_000_000),
-        'prob_below_15m': np.mean(results.terminal_wealth < 15_000_000)
+        'prob_below_0': int(at_or_below_zero) / n_sims,
+        'prob_below_1m': int(below_1m) / n_sims,
+        'prob_below_5m': int(below_5m) / n_sims,
+        'prob_below_10m': int(below_10m) / n_sims,
+        'prob_below_15m': int(below_15m) / n_sims
     }
     
     # Guardrail statistics
     guardrail_stats = {
-        'mean_hits': np.mean(results.guardrail_hits),
-        'median_hits': np.median(results.guardrail_hits),
-        'max_hits': np.max(results.guardrail_hits),
-        'pct_with_hits': np.mean(results.guardrail_hits > 0)
+        'mean_hits': float(np.mean(results.guardrail_hits)),
+        'median_hits': float(np.median(results.guardrail_hits)),
+        'max_hits': int(np.max(results.guardrail_hits)),
+        'pct_with_hits': float(np.mean(results.guardrail_hits > 0))
     }
     
-    # Depletion analysis
+    # Depletion analysis (evaluate the depleted mask once)
+    depleted = results.years_depleted > 0
+    num_depleted = np.count_nonzero(depleted)
     depletion_stats = {
-        'success_rate': results.success_rate,
-        'failure_rate': 1 - results.success_rate,
-        'avg_years_to_depletion': np.mean(results.years_depleted[results.years_depleted > 0]) 
-                                 if np.any(results.years_depleted > 0) else None
+        'success_rate': float(results.success_rate),
+        'failure_rate': float(1 - results.success_rate),
+        'avg_years_to_depletion': float(results.years_depleted[depleted].sum() / num_depleted)
+                                 if num_depleted else None
     }
     
     report = {
@@ -653,7 +801,32 @@ def export_summary_report_json(report: Dict[str, Any]) -> str:
     Returns:
         JSON string
     """
-    return json.dumps(report, indent=2, default=str)
+    return _json_dumps(report)
+
+
+# Deflate level for CSV entries in the batch export ZIP
+_CSV_COMPRESSLEVEL = 1
+
+# Entries smaller than this are stored uncompressed; deflating a few KB saves
+# little space and costs a compressor setup per entry
+_ZIP_STORE_THRESHOLD = 64 * 1024
+
+
+def _write_zip_json_entry(zip_file, name: str, obj: Any, default=None) -> None:
+    """Write obj as a JSON entry, storing it uncompressed when it is small"""
+    import zipfile
+    import zlib
+    
+    data = _json_dumps_bytes(obj, default=default)
+    if len(data) < _ZIP_STORE_THRESHOLD:
+        zip_file.writestr(name, data, compress_type=zipfile.ZIP_STORED)
+    else:
+        zip_file.writestr(name, data, compresslevel=zlib.Z_DEFAULT_COMPRESSION)
+
+
+def _open_zip_text_entry(zip_file, name: str) -> io.TextIOWrapper:
+    """Open a ZIP entry for streaming text writes (closing it finalizes the entry)"""
+    return io.TextIOWrapper(zip_file.open(name, 'w'), encoding='utf-8', newline='')
 
 
 def create_batch_export_zip(params: SimulationParams,
@@ -676,76 +849,125 @@ def create_batch_export_zip(params: SimulationParams,
     
     zip_buffer = io.BytesIO()
     
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+    # Archive-wide level 1 applies to the streamed CSVs: dense float tables get
+    # nearly the level-6 ratio at several times the speed. The JSON files are
+    # usually only a few KB and are stored as-is.
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED,
+                         compresslevel=_CSV_COMPRESSLEVEL) as zip_file:
+        # JSON entries are serialized straight to UTF-8 bytes (no str round trip)
         # Parameters JSON
-        params_json = create_parameters_download_json(params)
-        zip_file.writestr('parameters.json', params_json)
+        _write_zip_json_entry(zip_file, 'parameters.json', params_to_dict(params))
         
+        # CSVs are streamed straight into their entries rather than built as strings
         # Terminal wealth CSV
-        terminal_csv = export_terminal_wealth_csv(results.terminal_wealth)
-        zip_file.writestr('terminal_wealth.csv', terminal_csv)
+        with _open_zip_text_entry(zip_file, 'terminal_wealth.csv') as entry:
+            export_terminal_wealth_csv(results.terminal_wealth, buf=entry)
         
         # Percentile bands CSV (real)
-        percentiles_csv = export_percentile_bands_csv(years, percentiles, "real")
-        zip_file.writestr('percentile_bands_real.csv', percentiles_csv)
+        with _open_zip_text_entry(zip_file, 'percentile_bands_real.csv') as entry:
+            export_percentile_bands_csv(years, percentiles, "real", buf=entry)
         
         # Year-by-year details CSV (real)
-        details_csv = export_year_by_year_csv(results.median_path_details, "real")
-        zip_file.writestr('year_by_year_real.csv', details_csv)
+        with _open_zip_text_entry(zip_file, 'year_by_year_real.csv') as entry:
+            export_year_by_year_csv(results.median_path_details, "real", buf=entry)
         
         # Summary report JSON
         report = create_summary_report(params, results, "real")
-        report_json = export_summary_report_json(report)
-        zip_file.writestr('summary_report.json', report_json)
+        _write_zip_json_entry(zip_file, 'summary_report.json', report)
     
     zip_buffer.seek(0)
     return zip_buffer
 
 
-def validate_parameters_json(json_string: str) -> tuple[bool, str]:
+# Upper bound on uploaded parameters JSON size (characters)
+MAX_PARAMETERS_JSON_SIZE = 1_000_000
+
+# Fields an uploaded parameters JSON must define
+_REQUIRED_PARAM_FIELDS = ('start_capital', 'w_equity', 'w_bonds', 'w_real_estate', 'w_cash')
+_REQUIRED_PARAM_FIELD_SET = frozenset(_REQUIRED_PARAM_FIELDS)
+
+
+def parse_parameters_json(json_string: str) -> tuple[bool, str, Optional[SimulationParams]]:
     """
-    Validate uploaded parameters JSON.
+    Validate uploaded parameters JSON and build the SimulationParams object.
     
     Args:
         json_string: JSON string to validate
         
     Returns:
-        (is_valid, error_message)
+        (is_valid, error_message, params) - params is the validated
+        SimulationParams object, or None when validation fails
     """
+    # Parameter files are a few KB; reject oversized uploads before parsing them
+    if len(json_string) > MAX_PARAMETERS_JSON_SIZE:
+        return False, (f"Parameters file too large: {len(json_string):,} characters "
+                       f"(limit {MAX_PARAMETERS_JSON_SIZE:,})"), None
+    
     try:
-        param_dict = json.loads(json_string)
+        param_dict = loads_json(json_string)
+        if not isinstance(param_dict, dict):
+            return False, f"Parameters JSON must be an object, got {type(param_dict).__name__}", None
         
-        # Check required fields
-        required_fields = ['start_capital', 'w_equity', 'w_bonds', 'w_real_estate', 'w_cash']
-        for field in required_fields:
-            if field not in param_dict:
-                return False, f"Missing required field: {field}"
+        # Check required fields (report the first missing one in declaration order)
+        missing = _REQUIRED_PARAM_FIELD_SET - param_dict.keys()
+        if missing:
+            field = next(field for field in _REQUIRED_PARAM_FIELDS if field in missing)
+            return False, f"Missing required field: {field}", None
         
-        # Check allocation weights sum to 1
-        weights = [param_dict.get('w_equity', 0), param_dict.get('w_bonds', 0),
-                  param_dict.get('w_real_estate', 0), param_dict.get('w_cash', 0)]
-        if abs(sum(weights) - 1.0) > 1e-6:
-            return False, f"Allocation weights must sum to 1.0, got {sum(weights):.6f}"
+        # Check allocation weights sum to 1 (all four are present at this point)
+        weight_sum = math.fsum((param_dict['w_equity'], param_dict['w_bonds'],
+                                param_dict['w_real_estate'], param_dict['w_cash']))
+        if not math.isclose(weight_sum, 1.0, rel_tol=0.0, abs_tol=1e-6):
+            return False, f"Allocation weights must sum to 1.0, got {weight_sum:.6f}", None
         
         # Validate ranges
         if param_dict.get('start_capital', 0) <= 0:
-            return False, "Start capital must be positive"
+            return False, "Start capital must be positive", None
         
         if param_dict.get('horizon_years', 0) <= 0:
-            return False, "Horizon years must be positive"
+            return False, "Horizon years must be positive", None
         
         if param_dict.get('num_sims', 0) <= 0:
-            return False, "Number of simulations must be positive"
+            return False, "Number of simulations must be positive", None
         
-        # Try to create SimulationParams object
-        dict_to_params(param_dict)
+        # Build the SimulationParams object once; callers reuse it instead of re-parsing
+        params = dict_to_params(param_dict)
         
-        return True, ""
+        return True, "", params
         
     except json.JSONDecodeError as e:
-        return False, f"Invalid JSON: {str(e)}"
+        return False, f"Invalid JSON: {str(e)}", None
     except Exception as e:
-        return False, f"Parameter validation error: {str(e)}"
+        return False, f"Parameter validation error: {str(e)}", None
+
+
+def validate_parameters_json(json_string: str) -> tuple[bool, str]:
+    """
+    Validate uploaded parameters JSON.
+    
+    Args:
+        json_string: JSON string to validate
+        
+    Returns:
+        (is_valid, error_message)
+    """
+    is_valid, error_message, _ = parse_parameters_json(json_string)
+    return is_valid, error_message
+
+
+def _currency_formatter(precision: int, unit: str, label: str):
+    """Build a str.format callable such as '$1.5M (real)' for one precision/unit/label"""
+    return f"${{:.{precision}f}}{unit} ({label})".format
+
+
+# Formatters for the common precisions, built once so the format spec is not
+# re-assembled on every format_currency call
+_CURRENCY_FORMATTERS = {
+    (precision, unit, label): _currency_formatter(precision, unit, label)
+    for precision in range(5)
+    for unit in ('', 'K', 'M')
+    for label in ('real', 'nominal')
+}
 
 
 def format_currency(value: float, 
@@ -762,16 +984,20 @@ def format_currency(value: float,
     Returns:
         Formatted string
     """
-    if abs(value) >= 1_000_000:
-        formatted = f"${value/1_000_000:.{precision}f}M"
-    elif abs(value) >= 1_000:
-        formatted = f"${value/1_000:.{precision}f}K"
+    magnitude = abs(value)
+    if magnitude >= 1_000_000:
+        value, unit = value / 1_000_000, 'M'
+    elif magnitude >= 1_000:
+        value, unit = value / 1_000, 'K'
     else:
-        formatted = f"${value:.{precision}f}"
+        unit = ''
     
     # Add currency format indicator
-    suffix = " (real)" if currency_format == "real" else " (nominal)"
-    return formatted + suffix
+    label = 'real' if currency_format == 'real' else 'nominal'
+    formatter = _CURRENCY_FORMATTERS.get((precision, unit, label))
+    if formatter is None:
+        formatter = _currency_formatter(precision, unit, label)
+    return formatter(value)
 
 
 def unified_json_loader_ui(uploaded_file, target_format="monte_carlo"):
@@ -794,7 +1020,7 @@ def unified_json_loader_ui(uploaded_file, target_format="monte_carlo"):
 
     try:
         # Read the uploaded file
-        json_data = json.loads(uploaded_file.read())
+        json_data = parse_uploaded_json(uploaded_file.getvalue())
 
         # Show preview with key parameters
         col1, col2 = st.columns([3, 1])
@@ -868,152 +1094,128 @@ def _convert_to_monte_carlo_format(json_data: Dict[str, Any]) -> Dict[str, Any]:
         return json_data
 
 
+# (section, ((source_key, wizard_key, default), ...)) for wizard JSON exports
+_WIZARD_JSON_FIELD_MAP = (
+    ('basic_params', (
+        ('start_capital', 'start_capital', 2_500_000),
+        ('annual_spending', 'annual_spending', 150_000),
+        ('horizon_years', 'horizon_years', 50),
+        ('w_equity', 'w_equity', 0.65),
+        ('w_bonds', 'w_bonds', 0.25),
+        ('w_real_estate', 'w_real_estate', 0.08),
+        ('w_cash', 'w_cash', 0.02),
+    )),
+    ('tax_params', (
+        ('state', 'state', 'CA'),
+        ('filing_status', 'filing_status', 'married_filing_jointly'),
+    )),
+    ('social_security', (
+        ('ss_benefits_enabled', 'ss_benefits_enabled', True),
+        ('ss_annual_benefit', 'ss_annual_benefit', 40000),
+        ('ss_start_age', 'ss_start_age', 67),
+        ('ss_funding_scenario', 'ss_funding_scenario', 'moderate'),
+        ('spouse_ss_benefits_enabled', 'spouse_ss_benefits_enabled', False),
+        ('spouse_ss_annual_benefit', 'spouse_ss_annual_benefit', 20000),
+        ('spouse_ss_start_age', 'spouse_ss_start_age', 67),
+    )),
+    ('simulation', (
+        ('num_simulations', 'num_simulations', 10000),
+        ('market_regime', 'market_regime', 'baseline'),
+        ('cape_now', 'cape_now', 28.0),
+    )),
+    ('ai_config', (
+        ('enable_ai_analysis', 'enable_ai', False),
+        ('gemini_api_key', 'gemini_api_key', ''),
+        ('gemini_model', 'gemini_model', 'gemini-2.5-pro'),
+    )),
+    ('advanced_options', (
+        ('college_enabled', 'college_enabled', False),
+        ('college_amount', 'college_amount', 75000),
+        ('college_years', 'college_years', 8),
+        ('college_start_year', 'college_start_year', 2032),
+    )),
+)
+
+# (flat_key, wizard_key, default) for flat Monte Carlo exports
+_FLAT_TO_WIZARD_FIELD_MAP = (
+    # Basic parameters
+    ('start_capital', 'start_capital', 2_500_000),
+    ('annual_spending', 'annual_spending', 150_000),
+    ('horizon_years', 'horizon_years', 50),
+    ('start_year', 'start_year', 2025),
+    # Asset allocation - convert from simulation parameter names
+    ('w_equity', 'equity_pct', 0.65),
+    ('w_bonds', 'bonds_pct', 0.25),
+    ('w_real_estate', 'real_estate_pct', 0.08),
+    ('w_cash', 'cash_pct', 0.02),
+    ('glide_path_enabled', 'glide_path', False),
+    ('equity_reduction_per_year', 'equity_reduction_per_year', 0.005),
+    # Tax and state
+    ('state', 'state', 'CA'),
+    ('filing_status', 'filing_status', 'married_filing_jointly'),
+    # Social Security (convert from simulation parameter names to wizard names)
+    ('ss_annual_benefit', 'ss_primary_benefit', 40000),
+    ('ss_start_age', 'ss_primary_start_age', 67),
+    ('spouse_ss_annual_benefit', 'ss_spousal_benefit', 0),
+    ('spouse_ss_start_age', 'ss_spousal_start_age', 67),
+    ('ss_benefit_scenario', 'ss_funding_scenario', 'moderate'),
+    ('ss_custom_reduction', 'ss_custom_reduction', 0.15),
+    ('ss_reduction_start_year', 'ss_reduction_start_year', 2034),
+    # Simulation
+    ('num_sims', 'num_simulations', 10000),
+    ('regime', 'market_regime', 'baseline'),
+    ('cape_now', 'cape_now', 28.0),
+    # College expenses and inheritance
+    ('college_enabled', 'college_enabled', False),
+    ('college_base_amount', 'college_amount', 75000),
+    ('college_start_year', 'college_start_year', 2032),
+    ('inherit_amount', 'inheritance_amount', 0),
+    ('inherit_year', 'inheritance_year', 2040),
+)
+
+
 def _convert_json_to_wizard_params(wizard_json: Dict[str, Any]) -> Dict[str, Any]:
     """Convert wizard JSON back to wizard parameters format"""
     wizard_params = {}
 
-    # Basic parameters
-    basic = wizard_json.get('basic_params', {})
-    wizard_params.update({
-        'start_capital': basic.get('start_capital', 2_500_000),
-        'annual_spending': basic.get('annual_spending', 150_000),
-        'horizon_years': basic.get('horizon_years', 50),
-        'w_equity': basic.get('w_equity', 0.65),
-        'w_bonds': basic.get('w_bonds', 0.25),
-        'w_real_estate': basic.get('w_real_estate', 0.08),
-        'w_cash': basic.get('w_cash', 0.02),
-    })
-
-    # Tax parameters
-    tax = wizard_json.get('tax_params', {})
-    wizard_params.update({
-        'state': tax.get('state', 'CA'),
-        'filing_status': tax.get('filing_status', 'married_filing_jointly'),
-    })
-
-    # Social Security
-    ss = wizard_json.get('social_security', {})
-    wizard_params.update({
-        'ss_benefits_enabled': ss.get('ss_benefits_enabled', True),
-        'ss_annual_benefit': ss.get('ss_annual_benefit', 40000),
-        'ss_start_age': ss.get('ss_start_age', 67),
-        'ss_funding_scenario': ss.get('ss_funding_scenario', 'moderate'),
-        'spouse_ss_benefits_enabled': ss.get('spouse_ss_benefits_enabled', False),
-        'spouse_ss_annual_benefit': ss.get('spouse_ss_annual_benefit', 20000),
-        'spouse_ss_start_age': ss.get('spouse_ss_start_age', 67),
-    })
-
-    # Simulation parameters
-    simulation = wizard_json.get('simulation', {})
-    wizard_params.update({
-        'num_simulations': simulation.get('num_simulations', 10000),
-        'market_regime': simulation.get('market_regime', 'baseline'),
-        'cape_now': simulation.get('cape_now', 28.0)
-    })
-
-    # AI config
-    ai_config = wizard_json.get('ai_config', {})
-    wizard_params.update({
-        'enable_ai': ai_config.get('enable_ai_analysis', False),
-        'gemini_api_key': ai_config.get('gemini_api_key', ''),
-        'gemini_model': ai_config.get('gemini_model', 'gemini-2.5-pro')
-    })
-
-    # Cash flows
-    cash_flows = wizard_json.get('cash_flows', {})
+    for section, field_map in _WIZARD_JSON_FIELD_MAP:
+        source = wizard_json.get(section, _EMPTY_SECTION)
+        for source_key, wizard_key, default in field_map:
+            wizard_params[wizard_key] = source.get(source_key, default)
+
+    # Cash flows (fresh lists, so the defaults are never shared between calls)
+    cash_flows = wizard_json.get('cash_flows', _EMPTY_SECTION)
     wizard_params['income_streams'] = cash_flows.get('income_streams', [])
     wizard_params['expense_streams'] = cash_flows.get('expense_streams', [])
 
-    # Advanced options
-    advanced = wizard_json.get('advanced_options', {})
-    wizard_params.update({
-        'college_enabled': advanced.get('college_enabled', False),
-        'college_amount': advanced.get('college_amount', 75000),
-        'college_years': advanced.get('college_years', 8),
-        'college_start_year': advanced.get('college_start_year', 2032),
-    })
-
     return wizard_params
 
 
 def _convert_flat_to_wizard_params(flat_params: Dict[str, Any]) -> Dict[str, Any]:
     """Convert flat Monte Carlo parameters to wizard parameters format"""
-    wizard_params = {}
-
-    # Direct mappings for basic parameters (convert simulation names to wizard names)
-    wizard_params.update({
-        'start_capital': flat_params.get('start_capital', 2_500_000),
-        'annual_spending': flat_params.get('annual_spending', 150_000),
-        'horizon_years': flat_params.get('horizon_years', 50),
-        'start_year': flat_params.get('start_year', 2025),
-        # Asset allocation - convert from simulation parameter names
-        'equity_pct': flat_params.get('w_equity', 0.65),
-        'bonds_pct': flat_params.get('w_bonds', 0.25),
-        'real_estate_pct': flat_params.get('w_real_estate', 0.08),
-        'cash_pct': flat_params.get('w_cash', 0.02),
-        'glide_path': flat_params.get('glide_path_enabled', False),
-        'equity_reduction_per_year': flat_params.get('equity_reduction_per_year', 0.005),
-    })
-
-    # Tax and state
-    wizard_params.update({
-        'state': flat_params.get('state', 'CA'),
-        'filing_status': flat_params.get('filing_status', 'married_filing_jointly'),
-    })
-
-    # Social Security (convert from simulation parameter names to wizard names)
-    wizard_params.update({
-        'ss_primary_benefit': flat_params.get('ss_annual_benefit', 40000),
-        'ss_primary_start_age': flat_params.get('ss_start_age', 67),
-        'ss_spousal_benefit': flat_params.get('spouse_ss_annual_benefit', 0),
-        'ss_spousal_start_age': flat_params.get('spouse_ss_start_age', 67),
-        'ss_funding_scenario': flat_params.get('ss_benefit_scenario', 'moderate'),
-        'ss_custom_reduction': flat_params.get('ss_custom_reduction', 0.15),
-        'ss_reduction_start_year': flat_params.get('ss_reduction_start_year', 2034),
-    })
-
-    # Simulation
-    wizard_params.update({
-        'num_simulations': flat_params.get('num_sims', 10000),
-        'market_regime': flat_params.get('regime', 'baseline'),
-        'cape_now': flat_params.get('cape_now', 28.0)
-    })
+    wizard_params = {wizard_key: flat_params.get(flat_key, default)
+                     for flat_key, wizard_key, default in _FLAT_TO_WIZARD_FIELD_MAP}
 
     # Convert expense streams (flat format may have different structure)
     wizard_params['income_streams'] = []  # Would need to reconstruct from flat format
     wizard_params['expense_streams'] = flat_params.get('expense_streams', [])
 
-    # College expenses and inheritance (convert from flat format)
+    # College duration is derived from the start/end years
     college_years = 8  # default
     if flat_params.get('college_end_year') and flat_params.get('college_start_year'):
         college_years = flat_params['college_end_year'] - flat_params['college_start_year']
-
-    wizard_params.update({
-        'college_enabled': flat_params.get('college_enabled', False),
-        'college_amount': flat_params.get('college_base_amount', 75000),
-        'college_years': college_years,
-        'college_start_year': flat_params.get('college_start_year', 2032),
-        'inheritance_amount': flat_params.get('inherit_amount', 0),
-        'inheritance_year': flat_params.get('inherit_year', 2040),
-    })
+    wizard_params['college_years'] = college_years
 
     return wizard_params
 
 
-def _get_wizard_initial_spending(basic: Dict[str, Any]) -> Optional[float]:
-    """Extract initial spending from wizard basic parameters based on spending method"""
-    spending_method = basic.get('spending_method', 'cape')
-    if spending_method == 'fixed':
-        return basic.get('annual_spending', None)
-    else:
-        # For CAPE-based or manual, return None to use CAPE calculation
-        return None
-
-
 def _get_wizard_fixed_spending(basic: Dict[str, Any]) -> Optional[float]:
-    """Extract fixed annual spending from wizard basic parameters"""
-    spending_method = basic.get('spending_method', 'cape')
-    if spending_method == 'fixed':
-        return basic.get('annual_spending', None)
-    else:
-        return None
\ No newline at end of file
+    """
+    Extract fixed annual spending from wizard basic parameters.
+
+    Only the 'fixed' spending method carries an amount; CAPE-based or manual
+    spending returns None so the simulation uses the CAPE calculation.
+    """
+    if basic.get('spending_method', 'cape') == 'fixed':
+        return basic.get('annual_spending')
+    return None
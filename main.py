@@ -13,10 +13,8 @@ import streamlit as st
 def start_page():
     """Start page content"""
     # Initialize session state for shared parameters
-    if 'wizard_completed' not in st.session_state:
-        st.session_state.wizard_completed = False
-    if 'wizard_params' not in st.session_state:
-        st.session_state.wizard_params = {}
+    st.session_state.setdefault('wizard_completed', False)
+    st.session_state.setdefault('wizard_params', {})
 
     # Main page content
     st.title("🏦 Retirement Analysis Suite")
@@ -6,79 +6,130 @@ retirement planning with tax-aware withdrawals and Guyton-Klinger guardrails.
 """
 import streamlit as st
 import numpy as np
-import pandas as pd
-import plotly.graph_objects as go
 from typing import Dict, Any, Optional, Tuple
 import json
-import io
+import copy
+import hashlib
+from types import MappingProxyType
 
-# Import our modules
+# Import our modules. Chart builders, pandas and the AI client are imported
+# inside the functions that render results so sidebar-only reruns stay light.
 from simulation import SimulationParams, RetirementSimulator, calculate_percentiles, calculate_summary_stats
 from deterministic import DeterministicProjector, convert_to_nominal, create_nominal_table
-from tax import calculate_tax, effective_tax_rate, marginal_tax_rate
-from io_utils import convert_wizard_to_json, convert_wizard_json_to_simulation_params, create_parameters_download_json
-from charts import (
-    create_terminal_wealth_distribution, create_wealth_percentile_bands,
-    create_comparison_chart, create_spending_chart, create_withdrawal_rate_chart,
-    create_tax_analysis_chart, create_monte_carlo_paths_sample,
-    create_success_probability_over_time, create_cash_flow_waterfall,
-    create_sequence_of_returns_analysis, create_drawdown_analysis,
-    create_income_sources_stacked_area, create_asset_allocation_evolution
-)
-from ai_analysis import RetirementAnalyzer, create_mock_analysis, APIError
 from io_utils import (
+    convert_wizard_to_json, convert_wizard_json_to_simulation_params,
     create_parameters_download_json, parse_parameters_upload_json,
     export_terminal_wealth_csv, export_percentile_bands_csv, export_year_by_year_csv,
-    validate_parameters_json, format_currency, create_summary_report
+    validate_parameters_json, format_currency, create_summary_report, export_summary_report_json,
+    loads_json
 )
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Rough estimates combining federal and state effective rates, built once at import
+_STATE_TAX_RATES = {
+    'Federal Only': {
+        'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
+        'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
+    },
+    'CA': {  # High state tax
+        'MFJ': [(0, 0.13), (94_300, 0.31), (201_000, 0.36)],
+        'Single': [(0, 0.13), (47_150, 0.31), (100_500, 0.36)]
+    },
+    'NY': {  # High state tax
+        'MFJ': [(0, 0.14), (94_300, 0.30), (201_000, 0.35)],
+        'Single': [(0, 0.14), (47_150, 0.30), (100_500, 0.35)]
+    },
+    'TX': {  # No state income tax
+        'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
+        'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
+    },
+    'FL': {  # No state income tax
+        'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
+        'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
+    },
+    'WA': {  # No state income tax
+        'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
+        'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
+    },
+    'NV': {  # No state income tax
+        'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
+        'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
+    },
+    'PA': {  # Flat state tax
+        'MFJ': [(0, 0.13), (94_300, 0.25), (201_000, 0.27)],
+        'Single': [(0, 0.13), (47_150, 0.25), (100_500, 0.27)]
+    },
+    'OH': {  # Moderate state tax
+        'MFJ': [(0, 0.11), (94_300, 0.24), (201_000, 0.27)],
+        'Single': [(0, 0.11), (47_150, 0.24), (100_500, 0.27)]
+    },
+    'IL': {  # Flat state tax
+        'MFJ': [(0, 0.15), (94_300, 0.27), (201_000, 0.29)],
+        'Single': [(0, 0.15), (47_150, 0.27), (100_500, 0.29)]
+    }
+}
+
+
+# Sidebar blurb for each market regime
+_REGIME_DESCRIPTIONS = MappingProxyType({
+    'baseline': "📊 Normal expected returns throughout retirement",
+    'recession_recover': "📉 Early recession: -15% (Yr1) → 0% (Yr2) → normal",
+    'grind_lower': "⬇️ Poor returns (0.5% equity) for first 10 years",
+    'late_recession': "📉 Recession in mid-retirement (years 10-12)",
+    'inflation_shock': "🔥 High inflation period (years 3-7): bonds hurt, RE benefits",
+    'long_bear': "🐻 Extended bear market for 10 years (years 5-15)",
+    'tech_bubble': "💻 Tech bubble: high early returns → crash (years 4-6)",
+    'custom': "⚙️ User-defined shock pattern"
+})
+
+
+# Option lists and labels for sidebar selectors
+_REGIME_OPTIONS = tuple(_REGIME_DESCRIPTIONS)
+_STATE_OPTIONS = tuple(_STATE_TAX_RATES)
+
+_SPENDING_METHOD_LABELS = MappingProxyType({
+    'cape': "📊 CAPE-based (with guardrails)",
+    'fixed': "🔒 Fixed annual amount"
+})
+_SPENDING_METHOD_OPTIONS = tuple(_SPENDING_METHOD_LABELS)
+
+_SS_SCENARIO_LABELS = MappingProxyType({
+    'conservative': 'Conservative (19% cut in 2034)',
+    'moderate': 'Moderate (gradual cuts, partial reform)',
+    'optimistic': 'Optimistic (full benefits maintained)',
+    'custom': 'Custom (set your own reduction)'
+})
+_SS_SCENARIO_OPTIONS = tuple(_SS_SCENARIO_LABELS)
+
+_RE_FLOW_PRESET_OPTIONS = ('ramp', 'delayed', 'custom')
+_FILING_STATUS_OPTIONS = ('MFJ', 'Single')
+_CURRENCY_VIEW_OPTIONS = ('Real', 'Nominal')
+
+
+def _option_index(options):
+    """Read-only option -> position map for selectbox index lookups"""
+    return MappingProxyType({option: i for i, option in enumerate(options)})
+
+
+_REGIME_INDEX = _option_index(_REGIME_OPTIONS)
+_STATE_INDEX = _option_index(_STATE_OPTIONS)
+_SPENDING_METHOD_INDEX = _option_index(_SPENDING_METHOD_OPTIONS)
+_SS_SCENARIO_INDEX = _option_index(_SS_SCENARIO_OPTIONS)
+_RE_FLOW_PRESET_INDEX = _option_index(_RE_FLOW_PRESET_OPTIONS)
+_FILING_STATUS_INDEX = _option_index(_FILING_STATUS_OPTIONS)
+_CURRENCY_VIEW_INDEX = _option_index(_CURRENCY_VIEW_OPTIONS)
+
 
 def get_state_tax_rates(state, filing_status):
     """Get combined federal + state tax rates for common states"""
-    # These are rough estimates combining federal and state effective rates
-    state_rates = {
-        'Federal Only': {
-            'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
-            'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
-        },
-        'CA': {  # High state tax
-            'MFJ': [(0, 0.13), (94_300, 0.31), (201_000, 0.36)],
-            'Single': [(0, 0.13), (47_150, 0.31), (100_500, 0.36)]
-        },
-        'NY': {  # High state tax
-            'MFJ': [(0, 0.14), (94_300, 0.30), (201_000, 0.35)],
-            'Single': [(0, 0.14), (47_150, 0.30), (100_500, 0.35)]
-        },
-        'TX': {  # No state income tax
-            'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
-            'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
-        },
-        'FL': {  # No state income tax
-            'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
-            'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
-        },
-        'WA': {  # No state income tax
-            'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
-            'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
-        },
-        'NV': {  # No state income tax
-            'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
-            'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
-        },
-        'PA': {  # Flat state tax
-            'MFJ': [(0, 0.13), (94_300, 0.25), (201_000, 0.27)],
-            'Single': [(0, 0.13), (47_150, 0.25), (100_500, 0.27)]
-        },
-        'OH': {  # Moderate state tax
-            'MFJ': [(0, 0.11), (94_300, 0.24), (201_000, 0.27)],
-            'Single': [(0, 0.11), (47_150, 0.24), (100_500, 0.27)]
-        },
-        'IL': {  # Flat state tax
-            'MFJ': [(0, 0.15), (94_300, 0.27), (201_000, 0.29)],
-            'Single': [(0, 0.15), (47_150, 0.27), (100_500, 0.29)]
-        }
-    }
-    return state_rates.get(state, state_rates['Federal Only'])[filing_status]
+    # Copy the bracket list so callers can edit it without touching the table
+    return list(_STATE_TAX_RATES.get(state, _STATE_TAX_RATES['Federal Only'])[filing_status])
 
 
 def calculate_social_security_benefit(year, start_year, annual_benefit, scenario, custom_reduction, reduction_start_year, start_age):
@@ -112,14 +163,36 @@ def calculate_social_security_benefit(year, start_year, annual_benefit, scenario
     return base_benefit
 
 
+def _file_mtime_ns(path):
+    """Modification time of path in nanoseconds, or None if it cannot be read"""
+    import os
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def _read_ui_config(path, mtime_ns):
+    """Parse ui_config.json; cached until the file's mtime changes"""
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+
+@st.cache_data(show_spinner=False)
+def _load_default_params(path, mtime_ns):
+    """Read and validate default.json; cached until the file's mtime changes"""
+    from io_utils import parse_parameters_json
+    with open(path, 'r') as f:
+        return parse_parameters_json(f.read())
+
+
 def load_ui_config():
     """Load UI configuration like API keys from ui_config.json"""
     try:
-        import os
-        if os.path.exists('ui_config.json'):
-            with open('ui_config.json', 'r') as f:
-                config = json.load(f)
-            return config
+        mtime_ns = _file_mtime_ns('ui_config.json')
+        if mtime_ns is not None:
+            return _read_ui_config('ui_config.json', mtime_ns)
     except Exception as e:
         print(f"Warning: Could not load ui_config.json: {e}")
 
@@ -129,12 +202,136 @@ def load_ui_config():
 def save_ui_config(config):
     """Save UI configuration to ui_config.json"""
     try:
-        with open('ui_config.json', 'w') as f:
-            json.dump(config, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open('ui_config.json', 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open('ui_config.json', 'w') as f:
+                json.dump(config, f, indent=2)
     except Exception as e:
         print(f"Warning: Could not save ui_config.json: {e}")
 
 
+# Fallback session defaults (used if default.json doesn't exist or fails to load).
+# Built once at import; list values are copied before going into session state.
+_FALLBACK_DEFAULTS = MappingProxyType({
+    # Core setup
+    'start_year': 2026,
+    'retirement_age': 65,  # Standard retirement age
+    'horizon_years': 40,  # Retire at 65, plan to 95
+    'num_sims': 10_000,
+    'random_seed': None,
+    
+    # Start capital (accumulated over ~20-25 year career)
+    'capital_preset': '2,500,000',  # ~10x annual income saved
+    'custom_capital': 2_500_000,
+    'use_custom_capital': False,
+    
+    # Allocation weights (age-appropriate for 55-year-old)
+    'w_equity': 0.65,
+    'w_bonds': 0.25,
+    'w_real_estate': 0.08,
+    'w_cash': 0.02,
+
+    # Glide path (age-based allocation adjustment)
+    'glide_path_enabled': False,
+    'equity_reduction_per_year': 0.005,
+    
+    # Return model (conservative assumptions)
+    'equity_mean': 0.048,
+    'equity_vol': 0.18,
+    'bonds_mean': 0.015,
+    'bonds_vol': 0.07,
+    'real_estate_mean': 0.01,
+    'real_estate_vol': 0.10,
+    'cash_mean': 0.0,
+    'cash_vol': 0.0001,
+    
+    # CAPE and spending (California high cost of living)
+    'cape_now': 32.0,  # Market-dependent
+    'lower_wr': 0.050,  # Cut spending above this
+    'upper_wr': 0.032,  # Increase spending below this
+    'adjustment_pct': 0.10,
+    'spending_floor_real': 120_000,  # CA minimum lifestyle
+    'spending_ceiling_real': 200_000,  # Comfortable CA lifestyle
+    'floor_end_year': 2046,  # First 20 years of retirement
+    
+    # College expenses (2 children)
+    'college_enabled': True,
+    'college_base_amount': 100_000,
+    'college_start_year': 2032,
+    'college_end_year': 2041,
+    'college_growth_real': 0.015,  # Slightly above inflation
+    
+    # One-time expenses (realistic family expenses)
+    'onetime_expenses': [
+        {'year': 2030, 'amount': 75_000, 'description': 'Home renovation'},
+        {'year': 2035, 'amount': 50_000, 'description': 'Vehicle replacement'},
+        {'year': 2045, 'amount': 60_000, 'description': 'Healthcare/mobility upgrades'}
+    ],
+    
+    # Real estate cash flow (no rental income initially)
+    're_flow_enabled': False,
+    're_flow_preset': 'delayed',
+    're_flow_start_year': 2026,
+    're_flow_year1_amount': 50_000,
+    're_flow_year2_amount': 60_000,
+    're_flow_steady_amount': 75_000,
+    're_flow_delay_years': 0,
+    
+    # Inheritance (modest parental inheritance)
+    'inherit_amount': 400_000,
+    'inherit_year': 2038,
+    
+    # Other income streams (part-time work, consulting)
+    'other_income_streams': [
+        {'amount': 35_000, 'start_year': 2026, 'years': 5, 'description': 'Part-time consulting'},
+        {'amount': 20_000, 'start_year': 2028, 'years': 8, 'description': 'Board positions'}
+    ],
+    
+    # Currency view
+    'currency_view': 'Real',
+    'inflation_rate': 0.028,  # Slightly higher for California
+    
+    # Tax parameters (California MFJ)
+    'filing_status': 'MFJ',
+    'standard_deduction': 29_200,  # Federal standard deduction
+    'state_tax': 'CA',  # Default to California
+    'bracket_1_threshold': 0,
+    'bracket_1_rate': 0.13,  # Combined Fed+CA effective rate
+    'bracket_2_threshold': 94_300,
+    'bracket_2_rate': 0.31,  # Combined Fed+CA effective rate
+    'bracket_3_threshold': 201_000,
+    'bracket_3_rate': 0.36,  # Combined Fed+CA effective rate
+
+    # Social Security parameters
+    'social_security_enabled': True,
+    'ss_benefit_scenario': 'moderate',  # conservative, moderate, optimistic, custom
+    'ss_annual_benefit': 40_000,  # Estimated annual benefit
+    'ss_start_age': 67,  # Full retirement age
+    'ss_custom_reduction': 0.10,  # For custom scenario
+    'ss_reduction_start_year': 2034,  # When benefit cuts begin
+
+    # Spousal Social Security
+    'spouse_ss_enabled': False,
+    'spouse_ss_annual_benefit': 30_000,
+    'spouse_ss_start_age': 67,
+    
+    # Regime (baseline for demo)
+    'regime': 'baseline',
+    'custom_equity_shock_year': 0,
+    'custom_equity_shock_return': -0.20,
+    'custom_shock_duration': 1,
+    'custom_recovery_years': 2,
+    'custom_recovery_equity_return': 0.02,
+    
+    # Results caching
+    'simulation_results': None,
+    'deterministic_results': None,
+    'last_params_hash': None,
+})
+
+
 def initialize_session_state():
     """Initialize session state variables with defaults for hypothetical CA family ($250K income)"""
 
@@ -143,16 +340,12 @@ def initialize_session_state():
 
     # Try to load default.json if it exists
     try:
-        import os
-        if os.path.exists('default.json'):
-            with open('default.json', 'r') as f:
-                json_str = f.read()
-            
-            from io_utils import validate_parameters_json, parse_parameters_upload_json
-            is_valid, error = validate_parameters_json(json_str)
+        mtime_ns = _file_mtime_ns('default.json')
+        if mtime_ns is not None:
+            # Reruns reuse the parsed file until it changes on disk
+            is_valid, error, params = _load_default_params('default.json', mtime_ns)
             
             if is_valid:
-                params = parse_parameters_upload_json(json_str)
                 
                 # Load parameters from default.json
                 loaded_defaults = {
@@ -259,130 +452,12 @@ def initialize_session_state():
         # If any error occurs (file doesn't exist, invalid JSON, etc.), use hardcoded defaults
         loaded_defaults = {}
     
-    # Fallback defaults (used if default.json doesn't exist or fails to load)
-    defaults = {
-        # Core setup
-        'start_year': 2026,
-        'retirement_age': 65,  # Standard retirement age
-        'horizon_years': 40,  # Retire at 65, plan to 95
-        'num_sims': 10_000,
-        'random_seed': None,
-        
-        # Start capital (accumulated over ~20-25 year career)
-        'capital_preset': '2,500,000',  # ~10x annual income saved
-        'custom_capital': 2_500_000,
-        'use_custom_capital': False,
-        
-        # Allocation weights (age-appropriate for 55-year-old)
-        'w_equity': 0.65,
-        'w_bonds': 0.25,
-        'w_real_estate': 0.08,
-        'w_cash': 0.02,
-
-        # Glide path (age-based allocation adjustment)
-        'glide_path_enabled': False,
-        'equity_reduction_per_year': 0.005,
-        
-        # Return model (conservative assumptions)
-        'equity_mean': 0.048,
-        'equity_vol': 0.18,
-        'bonds_mean': 0.015,
-        'bonds_vol': 0.07,
-        'real_estate_mean': 0.01,
-        'real_estate_vol': 0.10,
-        'cash_mean': 0.0,
-        'cash_vol': 0.0001,
-        
-        # CAPE and spending (California high cost of living)
-        'cape_now': 32.0,  # Market-dependent
-        'lower_wr': 0.050,  # Cut spending above this
-        'upper_wr': 0.032,  # Increase spending below this
-        'adjustment_pct': 0.10,
-        'spending_floor_real': 120_000,  # CA minimum lifestyle
-        'spending_ceiling_real': 200_000,  # Comfortable CA lifestyle
-        'floor_end_year': 2046,  # First 20 years of retirement
-        
-        # College expenses (2 children)
-        'college_enabled': True,
-        'college_base_amount': 100_000,
-        'college_start_year': 2032,
-        'college_end_year': 2041,
-        'college_growth_real': 0.015,  # Slightly above inflation
-        
-        # One-time expenses (realistic family expenses)
-        'onetime_expenses': [
-            {'year': 2030, 'amount': 75_000, 'description': 'Home renovation'},
-            {'year': 2035, 'amount': 50_000, 'description': 'Vehicle replacement'},
-            {'year': 2045, 'amount': 60_000, 'description': 'Healthcare/mobility upgrades'}
-        ],
-        
-        # Real estate cash flow (no rental income initially)
-        're_flow_enabled': False,
-        're_flow_preset': 'delayed',
-        're_flow_start_year': 2026,
-        're_flow_year1_amount': 50_000,
-        're_flow_year2_amount': 60_000,
-        're_flow_steady_amount': 75_000,
-        're_flow_delay_years': 0,
-        
-        # Inheritance (modest parental inheritance)
-        'inherit_amount': 400_000,
-        'inherit_year': 2038,
-        
-        # Other income streams (part-time work, consulting)
-        'other_income_streams': [
-            {'amount': 35_000, 'start_year': 2026, 'years': 5, 'description': 'Part-time consulting'},
-            {'amount': 20_000, 'start_year': 2028, 'years': 8, 'description': 'Board positions'}
-        ],
-        
-        # Currency view
-        'currency_view': 'Real',
-        'inflation_rate': 0.028,  # Slightly higher for California
-        
-        # Tax parameters (California MFJ)
-        'filing_status': 'MFJ',
-        'standard_deduction': 29_200,  # Federal standard deduction
-        'state_tax': 'CA',  # Default to California
-        'bracket_1_threshold': 0,
-        'bracket_1_rate': 0.13,  # Combined Fed+CA effective rate
-        'bracket_2_threshold': 94_300,
-        'bracket_2_rate': 0.31,  # Combined Fed+CA effective rate
-        'bracket_3_threshold': 201_000,
-        'bracket_3_rate': 0.36,  # Combined Fed+CA effective rate
-
-        # Social Security parameters
-        'social_security_enabled': True,
-        'ss_benefit_scenario': 'moderate',  # conservative, moderate, optimistic, custom
-        'ss_annual_benefit': 40_000,  # Estimated annual benefit
-        'ss_start_age': 67,  # Full retirement age
-        'ss_custom_reduction': 0.10,  # For custom scenario
-        'ss_reduction_start_year': 2034,  # When benefit cuts begin
-
-        # Spousal Social Security
-        'spouse_ss_enabled': False,
-        'spouse_ss_annual_benefit': 30_000,
-        'spouse_ss_start_age': 67,
-        
-        # Regime (baseline for demo)
-        'regime': 'baseline',
-        'custom_equity_shock_year': 0,
-        'custom_equity_shock_return': -0.20,
-        'custom_shock_duration': 1,
-        'custom_recovery_years': 2,
-        'custom_recovery_equity_return': 0.02,
-        
-        # Results caching
-        'simulation_results': None,
-        'deterministic_results': None,
-        'last_params_hash': None,
-    }
-    
     # Use loaded_defaults if available, otherwise use fallback defaults
-    final_defaults = loaded_defaults if 'loaded_defaults' in locals() and loaded_defaults else defaults
+    final_defaults = loaded_defaults if 'loaded_defaults' in locals() and loaded_defaults else _FALLBACK_DEFAULTS
 
     for key, value in final_defaults.items():
         if key not in st.session_state:
-            st.session_state[key] = value
+            st.session_state[key] = copy.deepcopy(value) if isinstance(value, (list, dict)) else value
 
     # Initialize UI config items
     if 'gemini_api_key' not in st.session_state:
@@ -393,107 +468,251 @@ def initialize_session_state():
         st.session_state.gemini_model = ui_config.get('gemini_model', 'gemini-2.0-flash')
 
 
+# Start capital presets offered in the sidebar, label -> amount
+_CAPITAL_PRESETS = MappingProxyType({
+    '2,500,000': 2_500_000.0,
+    '3,000,000': 3_000_000.0,
+    '4,000,000': 4_000_000.0,
+})
+_CAPITAL_OPTIONS = (*_CAPITAL_PRESETS, 'Custom')
+_CAPITAL_INDEX = _option_index(_CAPITAL_OPTIONS)
+
+
+def preset_start_capital(capital_preset: str) -> float:
+    """Start capital for a preset label such as '2,500,000'"""
+    amount = _CAPITAL_PRESETS.get(capital_preset)
+    if amount is None:
+        # Labels outside the preset table (e.g. from older sessions)
+        amount = float(capital_preset.replace(',', ''))
+    return amount
+
+
 def get_current_params() -> SimulationParams:
     """Get current simulation parameters from session state"""
+    # One snapshot of session state; plain dict lookups below
+    ss = dict(st.session_state)
+
     # Determine start capital
-    if st.session_state.use_custom_capital:
-        start_capital = st.session_state.custom_capital
+    if ss['use_custom_capital']:
+        start_capital = ss['custom_capital']
     else:
-        start_capital = float(st.session_state.capital_preset.replace(',', ''))
+        start_capital = preset_start_capital(ss['capital_preset'])
     
     # Build tax brackets
     tax_brackets = [
-        (st.session_state.bracket_1_threshold, st.session_state.bracket_1_rate),
-        (st.session_state.bracket_2_threshold, st.session_state.bracket_2_rate),
-        (st.session_state.bracket_3_threshold, st.session_state.bracket_3_rate)
+        (ss['bracket_1_threshold'], ss['bracket_1_rate']),
+        (ss['bracket_2_threshold'], ss['bracket_2_rate']),
+        (ss['bracket_3_threshold'], ss['bracket_3_rate'])
     ]
     
     # Determine spending method parameters
     initial_base_spending = None
     fixed_annual_spending = None
 
-    spending_method = getattr(st.session_state, 'spending_method', 'cape')
+    spending_method = ss.get('spending_method', 'cape')
     if spending_method == 'fixed':
-        fixed_annual_spending = getattr(st.session_state, 'fixed_annual_spending', None)
+        fixed_annual_spending = ss.get('fixed_annual_spending', None)
     # For 'cape' method, both remain None (use CAPE calculation)
 
-    return SimulationParams(
-        start_year=st.session_state.start_year,
-        retirement_age=st.session_state.get('retirement_age', 65),
-        horizon_years=st.session_state.horizon_years,
-        num_sims=st.session_state.num_sims,
-        random_seed=st.session_state.random_seed,
-        start_capital=start_capital,
-        w_equity=st.session_state.w_equity,
-        w_bonds=st.session_state.w_bonds,
-        w_real_estate=st.session_state.w_real_estate,
-        w_cash=st.session_state.w_cash,
-        glide_path_enabled=st.session_state.get('glide_path_enabled', False),
-        equity_reduction_per_year=st.session_state.get('equity_reduction_per_year', 0.005),
-        equity_mean=st.session_state.equity_mean,
-        equity_vol=st.session_state.equity_vol,
-        bonds_mean=st.session_state.bonds_mean,
-        bonds_vol=st.session_state.bonds_vol,
-        real_estate_mean=st.session_state.real_estate_mean,
-        real_estate_vol=st.session_state.real_estate_vol,
-        cash_mean=st.session_state.cash_mean,
-        cash_vol=st.session_state.cash_vol,
-        cape_now=st.session_state.cape_now,
-        initial_base_spending=initial_base_spending,
-        fixed_annual_spending=fixed_annual_spending,
-        lower_wr=st.session_state.lower_wr,
-        upper_wr=st.session_state.upper_wr,
-        adjustment_pct=st.session_state.adjustment_pct,
-        spending_floor_real=st.session_state.spending_floor_real,
-        spending_ceiling_real=st.session_state.spending_ceiling_real,
-        floor_end_year=st.session_state.floor_end_year,
-        college_enabled=st.session_state.college_enabled,
-        college_base_amount=st.session_state.college_base_amount,
-        college_start_year=st.session_state.college_start_year,
-        college_end_year=st.session_state.college_end_year,
-        college_growth_real=st.session_state.college_growth_real,
-        expense_streams=st.session_state.onetime_expenses,
-        re_flow_enabled=st.session_state.re_flow_enabled,
-        re_flow_preset=st.session_state.re_flow_preset,
-        re_flow_start_year=st.session_state.re_flow_start_year,
-        re_flow_year1_amount=st.session_state.re_flow_year1_amount,
-        re_flow_year2_amount=st.session_state.re_flow_year2_amount,
-        re_flow_steady_amount=st.session_state.re_flow_steady_amount,
-        re_flow_delay_years=st.session_state.re_flow_delay_years,
-        inherit_amount=st.session_state.inherit_amount,
-        inherit_year=st.session_state.inherit_year,
+    params_kwargs: Dict[str, Any] = {
+        'start_year': ss['start_year'],
+        'retirement_age': ss.get('retirement_age', 65),
+        'horizon_years': ss['horizon_years'],
+        'num_sims': ss['num_sims'],
+        'random_seed': ss['random_seed'],
+        'start_capital': start_capital,
+        'w_equity': ss['w_equity'],
+        'w_bonds': ss['w_bonds'],
+        'w_real_estate': ss['w_real_estate'],
+        'w_cash': ss['w_cash'],
+        'glide_path_enabled': ss.get('glide_path_enabled', False),
+        'equity_reduction_per_year': ss.get('equity_reduction_per_year', 0.005),
+        'equity_mean': ss['equity_mean'],
+        'equity_vol': ss['equity_vol'],
+        'bonds_mean': ss['bonds_mean'],
+        'bonds_vol': ss['bonds_vol'],
+        'real_estate_mean': ss['real_estate_mean'],
+        'real_estate_vol': ss['real_estate_vol'],
+        'cash_mean': ss['cash_mean'],
+        'cash_vol': ss['cash_vol'],
+        'cape_now': ss['cape_now'],
+        'initial_base_spending': initial_base_spending,
+        'fixed_annual_spending': fixed_annual_spending,
+        'lower_wr': ss['lower_wr'],
+        'upper_wr': ss['upper_wr'],
+        'adjustment_pct': ss['adjustment_pct'],
+        'spending_floor_real': ss['spending_floor_real'],
+        'spending_ceiling_real': ss['spending_ceiling_real'],
+        'floor_end_year': ss['floor_end_year'],
+        'college_enabled': ss['college_enabled'],
+        'college_base_amount': ss['college_base_amount'],
+        'college_start_year': ss['college_start_year'],
+        'college_end_year': ss['college_end_year'],
+        'college_growth_real': ss['college_growth_real'],
+        'expense_streams': ss['onetime_expenses'],
+        're_flow_enabled': ss['re_flow_enabled'],
+        're_flow_preset': ss['re_flow_preset'],
+        're_flow_start_year': ss['re_flow_start_year'],
+        're_flow_year1_amount': ss['re_flow_year1_amount'],
+        're_flow_year2_amount': ss['re_flow_year2_amount'],
+        're_flow_steady_amount': ss['re_flow_steady_amount'],
+        're_flow_delay_years': ss['re_flow_delay_years'],
+        'inherit_amount': ss['inherit_amount'],
+        'inherit_year': ss['inherit_year'],
         # Pass income streams directly instead of flattening
-        income_streams=st.session_state.other_income_streams if st.session_state.other_income_streams else [],
+        'income_streams': ss['other_income_streams'] if ss['other_income_streams'] else [],
         # Legacy single stream parameters (for backward compatibility)
-        other_income_amount=0.0,
-        other_income_start_year=2026,
-        other_income_years=0,
-        filing_status=st.session_state.filing_status,
-        standard_deduction=st.session_state.standard_deduction,
-        tax_brackets=tax_brackets,
-        social_security_enabled=st.session_state.get('social_security_enabled', True),
-        ss_annual_benefit=st.session_state.get('ss_annual_benefit', 40000),
-        ss_start_age=st.session_state.get('ss_start_age', 67),
-        ss_benefit_scenario=st.session_state.get('ss_benefit_scenario', 'moderate'),
-        ss_custom_reduction=st.session_state.get('ss_custom_reduction', 0.10),
-        ss_reduction_start_year=st.session_state.get('ss_reduction_start_year', 2034),
-        spouse_ss_enabled=st.session_state.get('spouse_ss_enabled', False),
-        spouse_ss_annual_benefit=st.session_state.get('spouse_ss_annual_benefit', 30000),
-        spouse_ss_start_age=st.session_state.get('spouse_ss_start_age', 67),
-        regime=st.session_state.get('regime', 'baseline'),
-        custom_equity_shock_year=st.session_state.get('custom_equity_shock_year', 0),
-        custom_equity_shock_return=st.session_state.get('custom_equity_shock_return', -0.20),
-        custom_shock_duration=st.session_state.get('custom_shock_duration', 1),
-        custom_recovery_years=st.session_state.get('custom_recovery_years', 2),
-        custom_recovery_equity_return=st.session_state.get('custom_recovery_equity_return', 0.02)
-    )
+        'other_income_amount': 0.0,
+        'other_income_start_year': 2026,
+        'other_income_years': 0,
+        'filing_status': ss['filing_status'],
+        'standard_deduction': ss['standard_deduction'],
+        'tax_brackets': tax_brackets,
+        'social_security_enabled': ss.get('social_security_enabled', True),
+        'ss_annual_benefit': ss.get('ss_annual_benefit', 40000),
+        'ss_start_age': ss.get('ss_start_age', 67),
+        'ss_benefit_scenario': ss.get('ss_benefit_scenario', 'moderate'),
+        'ss_custom_reduction': ss.get('ss_custom_reduction', 0.10),
+        'ss_reduction_start_year': ss.get('ss_reduction_start_year', 2034),
+        'spouse_ss_enabled': ss.get('spouse_ss_enabled', False),
+        'spouse_ss_annual_benefit': ss.get('spouse_ss_annual_benefit', 30000),
+        'spouse_ss_start_age': ss.get('spouse_ss_start_age', 67),
+        'regime': ss.get('regime', 'baseline'),
+        'custom_equity_shock_year': ss.get('custom_equity_shock_year', 0),
+        'custom_equity_shock_return': ss.get('custom_equity_shock_return', -0.20),
+        'custom_shock_duration': ss.get('custom_shock_duration', 1),
+        'custom_recovery_years': ss.get('custom_recovery_years', 2),
+        'custom_recovery_equity_return': ss.get('custom_recovery_equity_return', 0.02),
+    }
+    return SimulationParams(**params_kwargs)
 
 
 def params_hash(params: SimulationParams) -> str:
     """Create hash of parameters for caching"""
-    import hashlib
     params_str = str(params)
-    return hashlib.md5(params_str.encode()).hexdigest()
+    return hashlib.blake2b(params_str.encode(), digest_size=8).hexdigest()
+
+
+def _stream_editor_rows(streams, description_prefix: str):
+    """Stream dicts as data_editor rows with a fixed column order"""
+    return [
+        {
+            'amount': stream.get('amount', 0),
+            'start_year': stream.get('start_year', stream.get('year', 0)),
+            'years': stream.get('years', 1),
+            'description': stream.get('description', f'{description_prefix} {i+1}')
+        }
+        for i, stream in enumerate(streams)
+    ]
+
+
+def _streams_from_editor_rows(rows, defaults: Dict[str, Any], description_prefix: str):
+    """Stream dicts from data_editor rows, filling blank cells in added rows"""
+    streams = []
+    for i, row in enumerate(rows):
+        stream = {}
+        for field, default in defaults.items():
+            try:
+                value = float(row.get(field))
+            except (TypeError, ValueError):  # blank cell (None or pd.NA)
+                value = float(default)
+            if value != value:  # NaN from a blank numeric cell
+                value = float(default)
+            stream[field] = int(value) if value.is_integer() else value
+        description = row.get('description')
+        stream['description'] = description if isinstance(description, str) and description else f'{description_prefix} {i+1}'
+        streams.append(stream)
+    return streams
+
+
+def _stream_column_config(defaults: Dict[str, Any]):
+    """Column setup shared by the expense and income stream editors"""
+    return {
+        'amount': st.column_config.NumberColumn("Annual Amount ($)", min_value=0, step=1_000, format="$%d", default=defaults['amount']),
+        'start_year': st.column_config.NumberColumn("Start Year", min_value=1900, step=1, format="%d", default=defaults['start_year']),
+        'years': st.column_config.NumberColumn("Duration", min_value=1, step=1, format="%d", default=defaults['years']),
+        'description': st.column_config.TextColumn("Description")
+    }
+
+
+def _stream_editor(key: str, state_name: str, defaults: Dict[str, Any], description_prefix: str):
+    """Stream table for st.session_state[state_name]; returns the edited stream dicts"""
+    base_key = f'{key}_base'
+    streams = st.session_state[state_name]
+    base = st.session_state.get(base_key)
+    # The table keeps its edits as deltas against the rows it was built from, so those
+    # rows stay fixed while editing and are rebuilt only when the streams change elsewhere
+    if base is None or key not in st.session_state or base['streams'] != streams:
+        base = {'streams': [dict(stream) for stream in streams],
+                'rows': _stream_editor_rows(streams, description_prefix)}
+        st.session_state[base_key] = base
+        st.session_state.pop(key, None)
+    
+    edited_rows = st.data_editor(
+        base['rows'],
+        num_rows="dynamic",
+        column_config=_stream_column_config(defaults),
+        column_order=('amount', 'start_year', 'years', 'description'),
+        hide_index=True,
+        key=key
+    )
+    edited = _streams_from_editor_rows(edited_rows, defaults, description_prefix)
+    if edited != streams:
+        st.session_state[state_name] = edited
+        base['streams'] = [dict(stream) for stream in edited]
+    return edited
+
+
+@st.fragment
+def _expense_streams_editor():
+    """Expense stream table; edits rerun only this fragment"""
+    with st.expander("Manage Expense Streams", expanded=True):
+        defaults = {'amount': 50_000, 'start_year': st.session_state.start_year + 5, 'years': 1}
+        # One table widget for all streams; rows are added and deleted in place
+        expenses = _stream_editor("mc_expense_streams_table", 'onetime_expenses', defaults, 'Expense stream')
+        
+        # Show summary if expense streams exist
+        if expenses:
+            total_current = sum([expense['amount'] for expense in expenses])
+            st.info(f"💸 Total current annual expenses: ${total_current:,}")
+
+
+@st.fragment
+def _income_streams_editor():
+    """Income stream table; edits rerun only this fragment"""
+    with st.expander("Manage Income Streams", expanded=True):
+        defaults = {'amount': 25_000, 'start_year': st.session_state.start_year + 2, 'years': 5}
+        # One table widget for all streams; rows are added and deleted in place
+        income_streams = _stream_editor("mc_income_streams_table", 'other_income_streams', defaults, 'Income stream')
+        
+        # Show summary if streams exist
+        if income_streams:
+            total_current = sum([stream['amount'] for stream in income_streams])
+            st.info(f"💰 Total current annual income: ${total_current:,}")
+
+
+def _on_state_tax_change():
+    """Load the newly selected state's tax brackets before the sidebar reruns"""
+    state = st.session_state.mc_state_tax
+    updates = {'state_tax': state}
+    for n, (threshold, rate) in enumerate(get_state_tax_rates(state, st.session_state.filing_status), start=1):
+        updates[f'bracket_{n}_threshold'] = threshold
+        updates[f'bracket_{n}_rate'] = rate
+    st.session_state.update(updates)
+
+
+_BRACKET_FIELDS = tuple(f'bracket_{n}_{part}' for n in (1, 2, 3) for part in ('threshold', 'rate'))
+
+
+def _on_tax_brackets_submit():
+    """Commit the submitted bracket inputs to the values the simulation reads"""
+    st.session_state.update({name: st.session_state[f'mc_{name}'] for name in _BRACKET_FIELDS})
+
+
+def _sync_widget_key(key: str, value):
+    """Point a keyed widget at its session value when that value changed elsewhere"""
+    if key not in st.session_state or st.session_state[key] != value:
+        st.session_state[key] = value
 
 
 def create_sidebar():
@@ -516,6 +735,10 @@ def create_sidebar():
         max_value=100,
         help="📊 **Length of retirement projection**\n\nNumber of years to simulate. Common values:\n• 30 years: Standard planning horizon\n• 50 years: Conservative for early retirement\n• 25 years: Traditional retirement at 65"
     )
+    # Horizon bounds shared by the year inputs below
+    start_year = st.session_state.start_year
+    horizon_years = st.session_state.horizon_years
+    end_year = start_year + horizon_years
     st.session_state.num_sims = st.sidebar.number_input(
         "Number of Simulations", 
         value=st.session_state.num_sims, 
@@ -542,11 +765,10 @@ def create_sidebar():
 
     # Start Capital
     st.sidebar.header("Start Capital")
-    capital_options = ['2,500,000', '3,000,000', '4,000,000', 'Custom']
     selected_capital = st.sidebar.selectbox(
         "Capital Preset", 
-        options=capital_options,
-        index=capital_options.index(st.session_state.capital_preset) if st.session_state.capital_preset in capital_options else 3,
+        options=_CAPITAL_OPTIONS,
+        index=_CAPITAL_INDEX.get(st.session_state.capital_preset, _CAPITAL_INDEX['Custom']),
         help="💰 **Initial portfolio value**\n\nTotal investable assets at retirement start. Presets represent different savings levels:\n• $2.5M: 10x annual income (strong saver)\n• $3.0M: 12x annual income (excellent saver)\n• $4.0M: 16x annual income (exceptional saver)\n• Custom: Enter your specific amount"
     )
     
@@ -591,49 +813,52 @@ def create_sidebar():
     # Return Model
     st.sidebar.header("Return Model (Real, Annual)")
     
-    with st.sidebar.expander("Expected Returns", expanded=False):
-        st.session_state.equity_mean = st.number_input(
-            "Equity Mean", value=st.session_state.equity_mean, format="%.3f",
-            help="📊 **Expected annual real return for stocks**\n\nHistorical average ~7% nominal, ~5% real after inflation. Accounts for long-term economic growth and corporate earnings.",
-            key="mc_equity_mean"
-        )
-        st.session_state.bonds_mean = st.number_input(
-            "Bonds Mean", value=st.session_state.bonds_mean, format="%.3f",
-            help="🏛️ **Expected annual real return for bonds**\n\nDepends on interest rates and credit quality. Currently low due to low yields. Historical real returns ~1-3%.",
-            key="mc_bonds_mean"
-        )
-        st.session_state.real_estate_mean = st.number_input(
-            "Real Estate Mean", value=st.session_state.real_estate_mean, format="%.3f",
-            help="🏘️ **Expected annual real return for REITs**\n\nCombines rental income and property appreciation. Historically ~2-4% real returns with inflation protection.",
-            key="mc_real_estate_mean"
-        )
-        st.session_state.cash_mean = st.number_input(
-            "Cash Mean", value=st.session_state.cash_mean, format="%.3f",
-            help="💵 **Expected annual real return for cash**\n\nTypically near zero real return (matches inflation). Provides stability and liquidity, not growth.",
-            key="mc_cash_mean"
-        )
+    # Edits in a form apply together on submit instead of rerunning per keystroke
+    with st.sidebar.form("mc_return_model_form"):
+        with st.expander("Expected Returns", expanded=False):
+            st.session_state.equity_mean = st.number_input(
+                "Equity Mean", value=st.session_state.equity_mean, format="%.3f",
+                help="📊 **Expected annual real return for stocks**\n\nHistorical average ~7% nominal, ~5% real after inflation. Accounts for long-term economic growth and corporate earnings.",
+                key="mc_equity_mean"
+            )
+            st.session_state.bonds_mean = st.number_input(
+                "Bonds Mean", value=st.session_state.bonds_mean, format="%.3f",
+                help="🏛️ **Expected annual real return for bonds**\n\nDepends on interest rates and credit quality. Currently low due to low yields. Historical real returns ~1-3%.",
+                key="mc_bonds_mean"
+            )
+            st.session_state.real_estate_mean = st.number_input(
+                "Real Estate Mean", value=st.session_state.real_estate_mean, format="%.3f",
+                help="🏘️ **Expected annual real return for REITs**\n\nCombines rental income and property appreciation. Historically ~2-4% real returns with inflation protection.",
+                key="mc_real_estate_mean"
+            )
+            st.session_state.cash_mean = st.number_input(
+                "Cash Mean", value=st.session_state.cash_mean, format="%.3f",
+                help="💵 **Expected annual real return for cash**\n\nTypically near zero real return (matches inflation). Provides stability and liquidity, not growth.",
+                key="mc_cash_mean"
+            )
     
-    with st.sidebar.expander("Volatilities", expanded=False):
-        st.session_state.equity_vol = st.number_input(
-            "Equity Volatility", value=st.session_state.equity_vol, format="%.3f",
-            help="📈 **Annual return volatility (standard deviation)**\n\nMeasures year-to-year variability. Equity: ~15-20%. Higher volatility = wider range of possible outcomes.",
-            key="mc_equity_vol"
-        )
-        st.session_state.bonds_vol = st.number_input(
-            "Bonds Volatility", value=st.session_state.bonds_vol, format="%.3f",
-            help="🏛️ **Bond return volatility**\n\nTypically 5-10%. Lower than stocks but still varies with interest rate changes and credit events.",
-            key="mc_bonds_vol"
-        )
-        st.session_state.real_estate_vol = st.number_input(
-            "Real Estate Volatility", value=st.session_state.real_estate_vol, format="%.3f",
-            help="🏘️ **REIT return volatility**\n\nTypically 8-15%. Less volatile than stocks, more than bonds. Affected by interest rates and property cycles.",
-            key="mc_real_estate_vol"
-        )
-        st.session_state.cash_vol = st.number_input(
-            "Cash Volatility", value=st.session_state.cash_vol, format="%.4f",
-            help="💵 **Cash return volatility**\n\nNear zero (~0.01%). Cash provides stability with minimal fluctuation in returns.",
-            key="mc_cash_vol"
-        )
+        with st.expander("Volatilities", expanded=False):
+            st.session_state.equity_vol = st.number_input(
+                "Equity Volatility", value=st.session_state.equity_vol, format="%.3f",
+                help="📈 **Annual return volatility (standard deviation)**\n\nMeasures year-to-year variability. Equity: ~15-20%. Higher volatility = wider range of possible outcomes.",
+                key="mc_equity_vol"
+            )
+            st.session_state.bonds_vol = st.number_input(
+                "Bonds Volatility", value=st.session_state.bonds_vol, format="%.3f",
+                help="🏛️ **Bond return volatility**\n\nTypically 5-10%. Lower than stocks but still varies with interest rate changes and credit events.",
+                key="mc_bonds_vol"
+            )
+            st.session_state.real_estate_vol = st.number_input(
+                "Real Estate Volatility", value=st.session_state.real_estate_vol, format="%.3f",
+                help="🏘️ **REIT return volatility**\n\nTypically 8-15%. Less volatile than stocks, more than bonds. Affected by interest rates and property cycles.",
+                key="mc_real_estate_vol"
+            )
+            st.session_state.cash_vol = st.number_input(
+                "Cash Volatility", value=st.session_state.cash_vol, format="%.4f",
+                help="💵 **Cash return volatility**\n\nNear zero (~0.01%). Cash provides stability with minimal fluctuation in returns.",
+                key="mc_cash_vol"
+            )
+        st.form_submit_button("Apply Return Model")
     
     # Spending & Guardrails
     st.sidebar.header("Spending & Guardrails")
@@ -657,7 +882,7 @@ def create_sidebar():
     if st.session_state.use_custom_capital:
         start_capital = st.session_state.custom_capital
     else:
-        start_capital = float(st.session_state.capital_preset.replace(',', ''))
+        start_capital = preset_start_capital(st.session_state.capital_preset)
 
     initial_spending_cape = cape_withdrawal_rate * start_capital
 
@@ -677,12 +902,9 @@ def create_sidebar():
 
     spending_method = st.sidebar.radio(
         "Spending Method",
-        options=['cape', 'fixed'],
-        format_func=lambda x: {
-            'cape': "📊 CAPE-based (with guardrails)",
-            'fixed': "🔒 Fixed annual amount"
-        }[x],
-        index=['cape', 'fixed'].index(st.session_state.spending_method if st.session_state.spending_method in ['cape', 'fixed'] else 'cape'),
+        options=_SPENDING_METHOD_OPTIONS,
+        format_func=_SPENDING_METHOD_LABELS.get,
+        index=_SPENDING_METHOD_INDEX.get(st.session_state.spending_method, 0),
         help="Choose spending approach:\n• CAPE: Market valuation-based calculation with guardrails\n• Fixed: Same amount every year (no guardrails)\n\nCAPE = Cyclically Adjusted P/E Ratio (measures market expensiveness)"
     )
     st.session_state.spending_method = spending_method
@@ -701,60 +923,62 @@ def create_sidebar():
 
     # Only show guardrails and spending bounds for CAPE-based spending
     if spending_method == 'cape':
-        with st.sidebar.expander("Guardrails (Guyton-Klinger)", expanded=False):
-            # Lower guardrail with text input for better decimal handling
-            lower_wr_str = st.text_input(
-                "Lower Guardrail",
-                value=f"{st.session_state.lower_wr:.3f}",
-                help="📉 **Minimum withdrawal rate trigger**\n\nWhen withdrawal rate falls below this, increase spending by adjustment %. Typically 2.8-3.5%. Enter as decimal (e.g., 0.028).",
-                key="mc_lower_wr_str"
-            )
-            try:
-                st.session_state.lower_wr = float(lower_wr_str)
-                if st.session_state.lower_wr < 0 or st.session_state.lower_wr > 0.1:
-                    st.error("Lower guardrail must be between 0.000 and 0.100")
+        if st.sidebar.toggle("Guardrails (Guyton-Klinger)", key="mc_show_guardrails"):
+            with st.sidebar:
+                # Lower guardrail with text input for better decimal handling
+                lower_wr_str = st.text_input(
+                    "Lower Guardrail",
+                    value=f"{st.session_state.lower_wr:.3f}",
+                    help="📉 **Minimum withdrawal rate trigger**\n\nWhen withdrawal rate falls below this, increase spending by adjustment %. Typically 2.8-3.5%. Enter as decimal (e.g., 0.028).",
+                    key="mc_lower_wr_str"
+                )
+                try:
+                    st.session_state.lower_wr = float(lower_wr_str)
+                    if st.session_state.lower_wr < 0 or st.session_state.lower_wr > 0.1:
+                        st.error("Lower guardrail must be between 0.000 and 0.100")
+                        st.session_state.lower_wr = 0.045
+                except ValueError:
+                    st.error("Please enter a valid decimal number (e.g., 0.045)")
                     st.session_state.lower_wr = 0.045
-            except ValueError:
-                st.error("Please enter a valid decimal number (e.g., 0.045)")
-                st.session_state.lower_wr = 0.045
-
-            # Upper guardrail with text input for better decimal handling
-            upper_wr_str = st.text_input(
-                "Upper Guardrail",
-                value=f"{st.session_state.upper_wr:.3f}",
-                help="📈 **Maximum withdrawal rate trigger**\n\nWhen withdrawal rate exceeds this, decrease spending by adjustment %. Typically 4.5-6.0%. Enter as decimal (e.g., 0.045).",
-                key="mc_upper_wr_str"
-            )
-            try:
-                st.session_state.upper_wr = float(upper_wr_str)
-                if st.session_state.upper_wr < 0 or st.session_state.upper_wr > 0.1:
-                    st.error("Upper guardrail must be between 0.000 and 0.100")
+
+                # Upper guardrail with text input for better decimal handling
+                upper_wr_str = st.text_input(
+                    "Upper Guardrail",
+                    value=f"{st.session_state.upper_wr:.3f}",
+                    help="📈 **Maximum withdrawal rate trigger**\n\nWhen withdrawal rate exceeds this, decrease spending by adjustment %. Typically 4.5-6.0%. Enter as decimal (e.g., 0.045).",
+                    key="mc_upper_wr_str"
+                )
+                try:
+                    st.session_state.upper_wr = float(upper_wr_str)
+                    if st.session_state.upper_wr < 0 or st.session_state.upper_wr > 0.1:
+                        st.error("Upper guardrail must be between 0.000 and 0.100")
+                        st.session_state.upper_wr = 0.032
+                except ValueError:
+                    st.error("Please enter a valid decimal number (e.g., 0.032)")
                     st.session_state.upper_wr = 0.032
-            except ValueError:
-                st.error("Please enter a valid decimal number (e.g., 0.032)")
-                st.session_state.upper_wr = 0.032
-            st.session_state.adjustment_pct = st.number_input(
-                "Adjustment %", value=st.session_state.adjustment_pct, format="%.2f",
-                help="⚖️ **Spending adjustment magnitude**\n\nPercentage to increase/decrease spending when guardrails trigger. Typically 10-15%.",
-                key="mc_adjustment_pct"
-            )
+                st.session_state.adjustment_pct = st.number_input(
+                    "Adjustment %", value=st.session_state.adjustment_pct, format="%.2f",
+                    help="⚖️ **Spending adjustment magnitude**\n\nPercentage to increase/decrease spending when guardrails trigger. Typically 10-15%.",
+                    key="mc_adjustment_pct"
+                )
 
-        with st.sidebar.expander("Spending Bounds", expanded=False):
-            st.session_state.spending_floor_real = st.number_input(
-                "Spending Floor ($)", value=st.session_state.spending_floor_real,
-                help="🛡️ **Minimum annual spending**\n\nAbsolute minimum spending level, regardless of portfolio performance. Covers essential expenses.",
-                key="mc_spending_floor_real"
-            )
-            st.session_state.spending_ceiling_real = st.number_input(
-                "Spending Ceiling ($)", value=st.session_state.spending_ceiling_real,
-                help="🏠 **Maximum annual spending**\n\nCaps spending even when portfolio performs well. Prevents lifestyle inflation and preserves capital.",
-                key="mc_spending_ceiling_real"
-            )
-            st.session_state.floor_end_year = st.number_input(
-                "Floor End Year", value=st.session_state.floor_end_year,
-                help="📅 **When floor protection ends**\n\nAfter this year, spending can go below the floor if necessary. Allows flexibility in later years.",
-                key="mc_floor_end_year"
-            )
+        if st.sidebar.toggle("Spending Bounds", key="mc_show_spending_bounds"):
+            with st.sidebar:
+                st.session_state.spending_floor_real = st.number_input(
+                    "Spending Floor ($)", value=st.session_state.spending_floor_real,
+                    help="🛡️ **Minimum annual spending**\n\nAbsolute minimum spending level, regardless of portfolio performance. Covers essential expenses.",
+                    key="mc_spending_floor_real"
+                )
+                st.session_state.spending_ceiling_real = st.number_input(
+                    "Spending Ceiling ($)", value=st.session_state.spending_ceiling_real,
+                    help="🏠 **Maximum annual spending**\n\nCaps spending even when portfolio performs well. Prevents lifestyle inflation and preserves capital.",
+                    key="mc_spending_ceiling_real"
+                )
+                st.session_state.floor_end_year = st.number_input(
+                    "Floor End Year", value=st.session_state.floor_end_year,
+                    help="📅 **When floor protection ends**\n\nAfter this year, spending can go below the floor if necessary. Allows flexibility in later years.",
+                    key="mc_floor_end_year"
+                )
     else:
         # Fixed spending mode - show info about what's disabled
         st.sidebar.info(
@@ -787,8 +1011,8 @@ def create_sidebar():
                 st.session_state.college_start_year = st.number_input(
                     "Start Year",
                     value=st.session_state.college_start_year,
-                    min_value=min(st.session_state.start_year, st.session_state.college_start_year),
-                    max_value=st.session_state.start_year + st.session_state.horizon_years,
+                    min_value=min(start_year, st.session_state.college_start_year),
+                    max_value=end_year,
                     help="📅 **When college expenses begin**\n\nFirst year college costs are incurred. Typically when your first child starts college.",
                     key="mc_college_start_year"
                 )
@@ -798,7 +1022,7 @@ def create_sidebar():
                     "End Year",
                     value=st.session_state.college_end_year,
                     min_value=st.session_state.college_start_year,
-                    max_value=st.session_state.start_year + st.session_state.horizon_years,
+                    max_value=end_year,
                     help="📅 **When college expenses end**\n\nLast year of college costs. Typically when your last child graduates college.",
                     key="mc_college_end_year"
                 )
@@ -812,58 +1036,23 @@ def create_sidebar():
             )
             
             # Show calculated summary
-            if st.session_state.college_enabled:
-                duration = st.session_state.college_end_year - st.session_state.college_start_year + 1
-                total_base = st.session_state.college_base_amount * duration
-                final_year_amount = st.session_state.college_base_amount * (1 + st.session_state.college_growth_real) ** (duration - 1)
-                
-                st.info(f"📊 **College Summary**\n\n"
-                       f"Duration: {duration} years ({st.session_state.college_start_year}-{st.session_state.college_end_year})\n\n"
-                       f"First year: ${st.session_state.college_base_amount:,.0f}\n\n"
-                       f"Final year: ${final_year_amount:,.0f}\n\n"
-                       f"Total (without growth): ${total_base:,.0f}")
+            duration = st.session_state.college_end_year - st.session_state.college_start_year + 1
+            total_base = st.session_state.college_base_amount * duration
+            final_year_amount = st.session_state.college_base_amount * (1 + st.session_state.college_growth_real) ** (duration - 1)
+            
+            st.info(f"📊 **College Summary**\n\n"
+                   f"Duration: {duration} years ({st.session_state.college_start_year}-{st.session_state.college_end_year})\n\n"
+                   f"First year: ${st.session_state.college_base_amount:,.0f}\n\n"
+                   f"Final year: ${final_year_amount:,.0f}\n\n"
+                   f"Total (without growth): ${total_base:,.0f}")
     else:
         st.sidebar.info("🚫 College expenses disabled")
     
     # Multi-Year Expenses
     st.sidebar.header("Multi-Year Expenses")
     
-    with st.sidebar.expander("Manage Expense Streams", expanded=True):
-        # Display existing expense streams
-        for i, expense in enumerate(st.session_state.onetime_expenses):
-            st.write(f"**Expense Stream {i+1}**")
-            col1, col2 = st.columns(2)
-            with col1:
-                new_amount = st.number_input(f"Annual Amount {i+1}", value=expense.get('amount', 50000), min_value=0, key=f"expense_amount_{i}")
-                new_start = st.number_input(f"Start Year {i+1}", value=expense.get('start_year', expense.get('year', st.session_state.start_year + 5)), min_value=min(st.session_state.start_year, expense.get('start_year', st.session_state.start_year)), key=f"expense_start_{i}")
-            with col2:
-                new_years = st.number_input(f"Duration {i+1}", value=expense.get('years', 1), min_value=1, key=f"expense_years_{i}")
-                if st.button("🗑️ Delete", key=f"delete_expense_{i}", help="Delete this expense stream"):
-                    st.session_state.onetime_expenses.pop(i)
-                    st.rerun()
-            
-            # Update the expense stream
-            st.session_state.onetime_expenses[i] = {
-                'amount': new_amount,
-                'start_year': new_start,
-                'years': new_years,
-                'description': expense.get('description', f'Expense stream {i+1}')
-            }
-        
-        # Add new expense stream button
-        if st.button("➕ Add Expense Stream"):
-            st.session_state.onetime_expenses.append({
-                'amount': 50_000,
-                'start_year': st.session_state.start_year + 5,
-                'years': 1,
-                'description': f'Expense stream {len(st.session_state.onetime_expenses) + 1}'
-            })
-            st.rerun()
-        
-        # Show summary if expense streams exist
-        if st.session_state.onetime_expenses:
-            total_current = sum([expense['amount'] for expense in st.session_state.onetime_expenses])
-            st.info(f"💸 Total current annual expenses: ${total_current:,}")
+    with st.sidebar:
+        _expense_streams_editor()
     
     # Real Estate Cash Flow
     st.sidebar.header("Real Estate Cash Flow")
@@ -877,8 +1066,8 @@ def create_sidebar():
     if st.session_state.re_flow_enabled:
         st.session_state.re_flow_preset = st.sidebar.selectbox(
             "Cash Flow Pattern",
-            options=['ramp', 'delayed', 'custom'],
-            index=['ramp', 'delayed', 'custom'].index(st.session_state.re_flow_preset),
+            options=_RE_FLOW_PRESET_OPTIONS,
+            index=_RE_FLOW_PRESET_INDEX.get(st.session_state.re_flow_preset, 0),
             help="🏘️ **Real estate income pattern**\n\n**Ramp**: $50K (Yr1) → $60K (Yr2) → $75K (Yr3+)\n**Delayed**: 5-year delay, then ramp up\n**Custom**: Configure your own amounts and timing",
             key="mc_re_flow_preset"
         )
@@ -888,8 +1077,8 @@ def create_sidebar():
                 st.session_state.re_flow_start_year = st.number_input(
                     "Start Year",
                     value=st.session_state.re_flow_start_year,
-                    min_value=min(st.session_state.start_year, st.session_state.re_flow_start_year),
-                    max_value=st.session_state.start_year + st.session_state.horizon_years,
+                    min_value=min(start_year, st.session_state.re_flow_start_year),
+                    max_value=end_year,
                     help="📅 **When real estate income begins**\n\nFirst year you expect to receive real estate cash flow.",
                     key="mc_re_flow_start_year"
                 )
@@ -962,82 +1151,35 @@ def create_sidebar():
     # Other Income
     st.sidebar.header("Other Income (Net of Tax)")
     
-    with st.sidebar.expander("Manage Income Streams", expanded=True):
-        # Display existing income streams
-        for i, stream in enumerate(st.session_state.other_income_streams):
-            st.write(f"**Income Stream {i+1}**")
-            col1, col2 = st.columns(2)
-            with col1:
-                new_amount = st.number_input(f"Annual Amount {i+1}", value=stream['amount'], min_value=0, key=f"income_amount_{i}")
-                new_start = st.number_input(f"Start Year {i+1}", value=stream['start_year'], min_value=min(st.session_state.start_year, stream['start_year']), key=f"income_start_{i}")
-            with col2:
-                new_years = st.number_input(f"Duration {i+1}", value=stream['years'], min_value=1, key=f"income_years_{i}")
-                if st.button("🗑️ Delete", key=f"delete_income_{i}", help="Delete this income stream"):
-                    st.session_state.other_income_streams.pop(i)
-                    st.rerun()
-            
-            # Update the income stream
-            st.session_state.other_income_streams[i] = {
-                'amount': new_amount,
-                'start_year': new_start,
-                'years': new_years,
-                'description': stream.get('description', f'Income stream {i+1}')
-            }
-        
-        # Add new income stream button
-        if st.button("➕ Add Income Stream"):
-            st.session_state.other_income_streams.append({
-                'amount': 25_000,
-                'start_year': st.session_state.start_year + 2,
-                'years': 5,
-                'description': f'Income stream {len(st.session_state.other_income_streams) + 1}'
-            })
-            st.rerun()
-        
-        # Show summary if streams exist
-        if st.session_state.other_income_streams:
-            total_current = sum([stream['amount'] for stream in st.session_state.other_income_streams])
-            st.info(f"💰 Total current annual income: ${total_current:,}")
+    with st.sidebar:
+        _income_streams_editor()
     
     # Tax Parameters
     st.sidebar.header("Tax Model")
     st.session_state.filing_status = st.sidebar.selectbox(
         "Filing Status",
-        options=['MFJ', 'Single'],
-        index=['MFJ', 'Single'].index(st.session_state.filing_status),
+        options=_FILING_STATUS_OPTIONS,
+        index=_FILING_STATUS_INDEX.get(st.session_state.filing_status, 0),
         help="👥 **Tax filing status**\n\nMFJ: Married Filing Jointly\nSingle: Single filer\n\nAffects standard deduction and tax brackets."
     )
 
-    # State tax selection
-    state_options = ['Federal Only', 'CA', 'NY', 'TX', 'FL', 'WA', 'NV', 'PA', 'OH', 'IL']
-    current_state = st.session_state.get('state_tax', 'CA')
-    if current_state not in state_options:
-        current_state = 'Federal Only'
-
-    selected_state = st.sidebar.selectbox(
+    # State tax selection; unknown states fall back to Federal Only. The keyed widget
+    # follows state_tax, which the change callback updates along with the brackets
+    state_tax = st.session_state.get('state_tax', 'CA')
+    _sync_widget_key("mc_state_tax", state_tax if state_tax in _STATE_INDEX else 'Federal Only')
+    st.sidebar.selectbox(
         "State Tax",
-        options=state_options,
-        index=state_options.index(current_state),
+        options=_STATE_OPTIONS,
         help="🏛️ **State for combined federal + state tax rates**\n\n"
              "**Federal Only**: Federal taxes only\n"
              "**CA/NY**: High state income tax\n"
              "**TX/FL/WA/NV**: No state income tax\n"
              "**PA/OH/IL**: Moderate state tax\n\n"
-             "Rates are rough estimates for retirement income."
+             "Rates are rough estimates for retirement income.",
+        key="mc_state_tax",
+        on_change=_on_state_tax_change
     )
 
-    # Update tax brackets if state changed
-    if selected_state != st.session_state.get('state_tax', 'CA'):
-        st.session_state.state_tax = selected_state
-        state_brackets = get_state_tax_rates(selected_state, st.session_state.filing_status)
-        st.session_state.bracket_1_threshold = state_brackets[0][0]
-        st.session_state.bracket_1_rate = state_brackets[0][1]
-        st.session_state.bracket_2_threshold = state_brackets[1][0]
-        st.session_state.bracket_2_rate = state_brackets[1][1]
-        st.session_state.bracket_3_threshold = state_brackets[2][0]
-        st.session_state.bracket_3_rate = state_brackets[2][1]
-        st.rerun()
-
     st.session_state.standard_deduction = st.sidebar.number_input(
         "Standard Deduction ($)",
         value=st.session_state.standard_deduction,
@@ -1045,37 +1187,42 @@ def create_sidebar():
         key="mc_standard_deduction"
     )
     
-    with st.sidebar.expander("Tax Brackets", expanded=False):
-        st.session_state.bracket_1_threshold = st.number_input(
-            "Bracket 1 Start ($)", value=st.session_state.bracket_1_threshold,
-            help="💰 **First tax bracket threshold**\n\nTaxable income level where this rate starts. Usually $0.",
-            key="mc_bracket_1_threshold"
-        )
-        st.session_state.bracket_1_rate = st.number_input(
-            "Bracket 1 Rate", value=st.session_state.bracket_1_rate, format="%.2f",
-            help="📊 **Tax rate for first bracket**\n\nDecimal format (0.10 = 10%). Typically 10-12%.",
-            key="mc_bracket_1_rate"
-        )
-        st.session_state.bracket_2_threshold = st.number_input(
-            "Bracket 2 Start ($)", value=st.session_state.bracket_2_threshold,
-            help="💰 **Second tax bracket threshold**\n\nIncome level where higher rate begins. MFJ ~$94K, Single ~$47K.",
-            key="mc_bracket_2_threshold"
-        )
-        st.session_state.bracket_2_rate = st.number_input(
-            "Bracket 2 Rate", value=st.session_state.bracket_2_rate, format="%.2f",
-            help="📊 **Tax rate for second bracket**\n\nTypically 22-24%. Applied to income above threshold.",
-            key="mc_bracket_2_rate"
-        )
-        st.session_state.bracket_3_threshold = st.number_input(
-            "Bracket 3 Start ($)", value=st.session_state.bracket_3_threshold,
-            help="💰 **Third tax bracket threshold**\n\nHigh-income bracket start. MFJ ~$201K, Single ~$100K.",
-            key="mc_bracket_3_threshold"
-        )
-        st.session_state.bracket_3_rate = st.number_input(
-            "Bracket 3 Rate", value=st.session_state.bracket_3_rate, format="%.2f",
-            help="📊 **Tax rate for third bracket**\n\nHighest rate modeled. Typically 24-32%.",
-            key="mc_bracket_3_rate"
-        )
+    if st.sidebar.toggle("Tax Brackets", key="mc_show_tax_brackets"):
+        # Inputs are keyed to the bracket values and write back only on submit
+        for name in _BRACKET_FIELDS:
+            _sync_widget_key(f'mc_{name}', st.session_state[name])
+        with st.sidebar.form("mc_tax_brackets_form"):
+            st.number_input(
+                "Bracket 1 Start ($)", step=1,
+                help="💰 **First tax bracket threshold**\n\nTaxable income level where this rate starts. Usually $0.",
+                key="mc_bracket_1_threshold"
+            )
+            st.number_input(
+                "Bracket 1 Rate", format="%.2f",
+                help="📊 **Tax rate for first bracket**\n\nDecimal format (0.10 = 10%). Typically 10-12%.",
+                key="mc_bracket_1_rate"
+            )
+            st.number_input(
+                "Bracket 2 Start ($)", step=1,
+                help="💰 **Second tax bracket threshold**\n\nIncome level where higher rate begins. MFJ ~$94K, Single ~$47K.",
+                key="mc_bracket_2_threshold"
+            )
+            st.number_input(
+                "Bracket 2 Rate", format="%.2f",
+                help="📊 **Tax rate for second bracket**\n\nTypically 22-24%. Applied to income above threshold.",
+                key="mc_bracket_2_rate"
+            )
+            st.number_input(
+                "Bracket 3 Start ($)", step=1,
+                help="💰 **Third tax bracket threshold**\n\nHigh-income bracket start. MFJ ~$201K, Single ~$100K.",
+                key="mc_bracket_3_threshold"
+            )
+            st.number_input(
+                "Bracket 3 Rate", format="%.2f",
+                help="📊 **Tax rate for third bracket**\n\nHighest rate modeled. Typically 24-32%.",
+                key="mc_bracket_3_rate"
+            )
+            st.form_submit_button("Apply Tax Brackets", on_click=_on_tax_brackets_submit)
 
     # Social Security Parameters
     st.sidebar.header("Social Security")
@@ -1104,19 +1251,11 @@ def create_sidebar():
             help="🎂 **Age to start collecting Social Security** (can be different from retirement age)\n\n• **Age 62**: Early claiming, ~25% benefit reduction\n• **Age 67**: Full retirement age, 100% of benefit\n• **Age 70**: Maximum benefits, ~32% increase\n\n💡 **Common strategies**:\n• Retire at 65, start SS at 67 (bridge gap with portfolio)\n• Retire at 67, start SS immediately (full benefits)\n• Retire at 62, delay SS to 70 (maximize lifetime benefits)"
         )
 
-        scenario_options = ['conservative', 'moderate', 'optimistic', 'custom']
-        scenario_labels = {
-            'conservative': 'Conservative (19% cut in 2034)',
-            'moderate': 'Moderate (gradual cuts, partial reform)',
-            'optimistic': 'Optimistic (full benefits maintained)',
-            'custom': 'Custom (set your own reduction)'
-        }
-
         st.session_state.ss_benefit_scenario = st.sidebar.selectbox(
             "Funding Scenario",
-            options=scenario_options,
-            index=scenario_options.index(st.session_state.get('ss_benefit_scenario', 'moderate')),
-            format_func=lambda x: scenario_labels[x],
+            options=_SS_SCENARIO_OPTIONS,
+            index=_SS_SCENARIO_INDEX.get(st.session_state.get('ss_benefit_scenario', 'moderate'), _SS_SCENARIO_INDEX['moderate']),
+            format_func=_SS_SCENARIO_LABELS.get,
             help="📊 **Social Security trust fund scenarios**\n\n"
                  "**Conservative**: Full 19% benefit cut starting 2034 (current law)\n"
                  "**Moderate**: Gradual cuts with partial Congressional reforms\n"
@@ -1171,16 +1310,13 @@ def create_sidebar():
     # Market Regime
     st.sidebar.header("Market Regime")
     
-    regime_options = ['baseline', 'recession_recover', 'grind_lower', 'late_recession', 
-                     'inflation_shock', 'long_bear', 'tech_bubble', 'custom']
-    
     # Ensure regime value is preserved from wizard or previous selections
     current_regime = st.session_state.get('regime', 'baseline')
-    current_index = regime_options.index(current_regime) if current_regime in regime_options else 0
+    current_index = _REGIME_INDEX.get(current_regime, 0)
 
     selected_regime = st.sidebar.selectbox(
         "Market Scenario",
-        options=regime_options,
+        options=_REGIME_OPTIONS,
         index=current_index,
         help="📈 **Market scenario to model**\n\n"
              "**Baseline**: Expected returns throughout\n"
@@ -1198,19 +1334,8 @@ def create_sidebar():
     st.session_state.regime = selected_regime
 
     # Show regime descriptions
-    regime_descriptions = {
-        'baseline': "📊 Normal expected returns throughout retirement",
-        'recession_recover': "📉 Early recession: -15% (Yr1) → 0% (Yr2) → normal",
-        'grind_lower': "⬇️ Poor returns (0.5% equity) for first 10 years",
-        'late_recession': "📉 Recession in mid-retirement (years 10-12)",
-        'inflation_shock': "🔥 High inflation period (years 3-7): bonds hurt, RE benefits",
-        'long_bear': "🐻 Extended bear market for 10 years (years 5-15)",
-        'tech_bubble': "💻 Tech bubble: high early returns → crash (years 4-6)",
-        'custom': "⚙️ User-defined shock pattern"
-    }
-    
-    if st.session_state.regime in regime_descriptions:
-        st.sidebar.info(regime_descriptions[st.session_state.regime])
+    if st.session_state.regime in _REGIME_DESCRIPTIONS:
+        st.sidebar.info(_REGIME_DESCRIPTIONS[st.session_state.regime])
     
     # Custom regime controls
     if st.session_state.regime == 'custom':
@@ -1219,7 +1344,7 @@ def create_sidebar():
                 "Shock Start Year (0-based)",
                 value=st.session_state.custom_equity_shock_year,
                 min_value=0,
-                max_value=st.session_state.horizon_years - 1,
+                max_value=horizon_years - 1,
                 help="📅 **When the market shock begins**\n\n0 = First year of retirement, 1 = Second year, etc.",
                 key="mc_custom_equity_shock_year"
             )
@@ -1280,8 +1405,8 @@ def create_sidebar():
     st.sidebar.header("Currency View")
     st.session_state.currency_view = st.sidebar.selectbox(
         "Display Currency", 
-        options=['Real', 'Nominal'], 
-        index=['Real', 'Nominal'].index(st.session_state.currency_view),
+        options=_CURRENCY_VIEW_OPTIONS, 
+        index=_CURRENCY_VIEW_INDEX.get(st.session_state.currency_view, 0),
         help="💲 **How to display monetary values**\n\n**Real**: Inflation-adjusted dollars (constant purchasing power)\n**Nominal**: Future dollars (includes inflation effects)\n\nReal dollars are better for planning; nominal shows actual future amounts."
     )
     if st.session_state.currency_view == 'Nominal':
@@ -1331,12 +1456,31 @@ def run_simulations():
         
         with st.spinner("Running deterministic projection..."):
             projector = DeterministicProjector(params)
-            st.session_state.deterministic_results = projector.run_projection()
+            st.session_state.deterministic_results = projector.run_cached()
         
         st.session_state.last_params_hash = current_hash
         st.success("Simulations completed!")
 
 
+def get_results_percentiles(results) -> Dict[str, np.ndarray]:
+    """Real-dollar percentile bands for results, computed once per simulation run"""
+    cached = st.session_state.get('results_percentiles')
+    if cached is None or cached[0] is not results:
+        cached = (results, calculate_percentiles(results.wealth_paths))
+        st.session_state.results_percentiles = cached
+    # Callers swap in nominal arrays, so hand out a fresh dict
+    return dict(cached[1])
+
+
+def get_results_summary_stats(results) -> Dict[str, float]:
+    """Real-dollar terminal wealth stats for results, computed once per simulation run"""
+    cached = st.session_state.get('results_summary_stats')
+    if cached is None or cached[0] is not results:
+        cached = (results, calculate_summary_stats(results.terminal_wealth))
+        st.session_state.results_summary_stats = cached
+    return dict(cached[1])
+
+
 def display_parameter_preview():
     """Display parameter preview with validation and diff analysis"""
     try:
@@ -1480,7 +1624,7 @@ def display_summary_kpis():
         return
     
     results = st.session_state.simulation_results
-    terminal_stats = calculate_summary_stats(results.terminal_wealth)
+    terminal_stats = get_results_summary_stats(results)
     
     st.header("Summary KPIs")
     
@@ -1524,6 +1668,7 @@ def display_summary_kpis():
 
 def display_ai_analysis_section():
     """Display the AI analysis configuration and trigger section"""
+    from ai_analysis import RetirementAnalyzer, create_mock_analysis, APIError
     if st.session_state.simulation_results is None:
         return
 
@@ -1650,7 +1795,7 @@ def display_ai_analysis_section():
 
                 # Get current results and recalculate stats (needed after button rerun)
                 current_results = st.session_state.simulation_results
-                current_terminal_stats = calculate_summary_stats(current_results.terminal_wealth)
+                current_terminal_stats = get_results_summary_stats(current_results)
 
                 if gemini_api_key:
                     try:
@@ -1737,6 +1882,7 @@ def display_ai_analysis(analysis):
 
 def display_chat_interface():
     """Display interactive chat interface for follow-up questions"""
+    from ai_analysis import RetirementAnalyzer, APIError
     api_key = st.session_state.get('gemini_api_key', '')
     if not api_key:
         return
@@ -1821,6 +1967,11 @@ def display_chat_interface():
 
 def display_charts():
     """Display interactive charts"""
+    from charts import (
+        create_terminal_wealth_distribution, create_wealth_percentile_bands,
+        create_withdrawal_rate_chart, create_income_sources_stacked_area,
+        create_asset_allocation_evolution
+    )
     if st.session_state.simulation_results is None:
         return
     
@@ -1844,7 +1995,7 @@ def display_charts():
     # Percentile bands
     st.subheader("Wealth Percentile Bands Over Time")
     years = np.arange(st.session_state.start_year, st.session_state.start_year + st.session_state.horizon_years + 1)
-    percentiles = calculate_percentiles(results.wealth_paths)
+    percentiles = get_results_percentiles(results)
     
     if st.session_state.currency_view == "Nominal":
         for key in percentiles:
@@ -1915,6 +2066,7 @@ def get_percentile_path_details(results, percentile):
 
 def display_year_by_year_table():
     """Display year-by-year path table with percentile selection"""
+    import pandas as pd
     print(f"DEBUG [display_year_by_year_table]: Called, simulation_results exists: {st.session_state.simulation_results is not None}")
     if st.session_state.simulation_results is None:
         print(f"DEBUG [display_year_by_year_table]: No simulation results, returning early")
@@ -2052,7 +2204,7 @@ def display_downloads():
         # Percentile bands CSV
         # wealth_paths includes initial wealth (year 0) + horizon_years, so total length is horizon_years + 1
         years = np.arange(st.session_state.start_year, st.session_state.start_year + results.wealth_paths.shape[1])
-        percentiles = calculate_percentiles(results.wealth_paths)
+        percentiles = get_results_percentiles(results)
 
         currency_suffix = st.session_state.currency_view.lower()
         if st.session_state.currency_view == "Nominal":
@@ -2073,7 +2225,7 @@ def display_downloads():
         # Summary report JSON
         params = get_current_params()
         report = create_summary_report(params, results, currency_suffix)
-        report_json = json.dumps(report, indent=2, default=str)
+        report_json = export_summary_report_json(report)
         
         st.download_button(
             label="Download Summary Report JSON",
@@ -16,7 +16,7 @@ from datetime import datetime
 import math
 
 # Import from main app for compatibility
-from io_utils import create_parameters_download_json, convert_wizard_to_json
+from io_utils import create_parameters_download_json, convert_wizard_to_json, parse_uploaded_json
 from simulation import SimulationParams
 from ai_analysis import RetirementAnalyzer
 import sys
@@ -25,7 +25,7 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from wizard_charts import create_allocation_pie_chart, create_risk_return_scatter
 from wizard_utils import convert_json_to_wizard_params, convert_flat_to_wizard_params
 from config_utils import (
-    load_ui_config, save_ui_config, WIZARD_STEPS, get_default_wizard_params,
+    load_ui_config, save_ui_config, WIZARD_STEPS, WIZARD_STEP_INDEX, get_default_wizard_params,
     get_wizard_widget_mappings, get_widget_keys_for_immediate_sync
 )
 
@@ -170,7 +170,7 @@ def create_progress_bar():
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
         st.progress(progress)
-        st.caption(f"Step {current_step + 1} of {total_steps}: {WIZARD_STEPS[current_step]['title']}")
+        st.caption(f"Step {current_step + 1} of {total_steps}: {WIZARD_STEPS[current_step].title}")
 
 def create_navigation_buttons():
     """Create navigation buttons"""
@@ -245,7 +245,7 @@ def step_welcome():
         if uploaded_file is not None:
             try:
                 # Read the uploaded file
-                json_data = json.loads(uploaded_file.read())
+                json_data = parse_uploaded_json(uploaded_file.getvalue())
 
                 col1, col2 = st.columns([3, 1])
 
@@ -278,7 +278,7 @@ def step_welcome():
                     if st.session_state.params_loaded_and_waiting_for_choice:
                         if st.button("🧙‍♂️ Review in Wizard", key="review_in_wizard"):
                             st.session_state.params_loaded_and_waiting_for_choice = False  # Reset flag
-                            st.session_state.wizard_step = 1  # Move to step 1
+                            st.session_state.wizard_step = WIZARD_STEP_INDEX['basics']
                             st.rerun()
 
                         if st.button("🚀 Jump to Simulation", type="primary", key="jump_to_simulation"):
@@ -2598,32 +2598,27 @@ if st.session_state.get('jump_to_sim_requested', False):
     st.switch_page("pages/monte_carlo.py")
 
 # Route to appropriate step
-current_step_id = WIZARD_STEPS[st.session_state.wizard_step]['id']
-
-if current_step_id == 'welcome':
-    step_welcome()
-elif current_step_id == 'basics':
-    step_basics()
-elif current_step_id == 'allocation':
-    step_allocation()
-elif current_step_id == 'market':
-    step_market()
-elif current_step_id == 'taxes':
-    step_taxes()
-elif current_step_id == 'social_security':
-    step_social_security()
-elif current_step_id == 'guardrails':
-    step_guardrails()
-elif current_step_id == 'cash_flows':
-    step_cash_flows()
-elif current_step_id == 'ai_setup':
-    step_ai_setup()
-elif current_step_id == 'advanced':
-    step_advanced()
-elif current_step_id == 'review':
-    step_review()
-# Steps under construction
+current_step_id = WIZARD_STEPS[st.session_state.wizard_step].id
+
+STEP_RENDERERS = {
+    'welcome': step_welcome,
+    'basics': step_basics,
+    'allocation': step_allocation,
+    'market': step_market,
+    'taxes': step_taxes,
+    'social_security': step_social_security,
+    'guardrails': step_guardrails,
+    'cash_flows': step_cash_flows,
+    'ai_setup': step_ai_setup,
+    'advanced': step_advanced,
+    'review': step_review,
+}
+
+render_step = STEP_RENDERERS.get(current_step_id)
+if render_step is not None:
+    render_step()
 else:
+    # Steps under construction
     st.info(f"Step '{current_step_id}' is under construction!")
     st.markdown("Coming soon: Interactive parameter setup with beautiful visualizations")
 
@@ -2633,7 +2628,7 @@ st.markdown("---")
 create_navigation_buttons()
 
 # Add multipage navigation after wizard completion
-if st.session_state.wizard_step == len(WIZARD_STEPS) - 1:  # On review step
+if st.session_state.wizard_step == WIZARD_STEP_INDEX['review']:
     st.markdown("---")
     st.markdown("### 🚀 Ready for Analysis!")
 
@@ -221,6 +221,16 @@ class RetirementSimulator:
             if start_year <= year < start_year + years:
                 total += stream.get('amount', 0)
         return total
+
+    def _get_onetime_expenses_by_year(self) -> np.ndarray:
+        """Expense stream totals for every horizon year, indexed by year offset"""
+        years = self.params.start_year + np.arange(self.params.horizon_years)
+        total = np.zeros(self.params.horizon_years)
+        for stream in self.params.expense_streams:
+            start_year = stream.get('start_year', stream.get('year', 0))
+            active = (years >= start_year) & (years < start_year + stream.get('years', 1))
+            total[active] += stream.get('amount', 0)
+        return total
     
     def _get_other_income(self, year: int) -> float:
         """Get other income for given year (real dollars, net of tax)"""
@@ -248,6 +258,28 @@ class RetirementSimulator:
                 return self.params.other_income_amount
             return 0
 
+    def _get_other_income_by_year(self) -> np.ndarray:
+        """Other income for every horizon year, indexed by year offset"""
+        years = self.params.start_year + np.arange(self.params.horizon_years)
+        total_income = np.zeros(self.params.horizon_years)
+        streams = self.params.income_streams
+        if streams is not None and len(streams) > 0:
+            # Stream columns as parallel float arrays (fractional start/years are allowed),
+            # summed in stream order with the same offset test as _get_other_income
+            count = len(streams)
+            starts = np.fromiter((stream['start_year'] for stream in streams), np.float64, count=count)
+            durations = np.fromiter((stream['years'] for stream in streams), np.float64, count=count)
+            amounts = np.fromiter((stream['amount'] for stream in streams), np.float64, count=count)
+            for start, duration, amount in zip(starts, durations, amounts):
+                offsets = years - start
+                total_income[(offsets >= 0) & (offsets < duration)] += amount
+        elif self.params.other_income_years != 0:
+            # Legacy single stream logic
+            offsets = years - self.params.other_income_start_year
+            active = (offsets >= 0) & (offsets < self.params.other_income_years)
+            total_income[active] = self.params.other_income_amount
+        return total_income
+
     def _get_social_security_income(self, year: int) -> float:
         """Get Social Security income for given year (real dollars, net of tax)"""
         total_ss_income = 0
@@ -281,6 +313,41 @@ class RetirementSimulator:
             )
 
         return total_ss_income
+
+    def _get_social_security_income_by_year(self) -> np.ndarray:
+        """Social Security income for every horizon year, indexed by year offset"""
+        from tax_utils import calculate_social_security_benefits
+
+        years = self.params.start_year + np.arange(self.params.horizon_years)
+        total_ss_income = np.zeros(self.params.horizon_years)
+
+        # Primary Social Security
+        if self.params.social_security_enabled:
+            total_ss_income += calculate_social_security_benefits(
+                years=years,
+                start_year=self.params.start_year,
+                retirement_age=self.params.retirement_age,
+                annual_benefit=self.params.ss_annual_benefit,
+                scenario=self.params.ss_benefit_scenario,
+                custom_reduction=self.params.ss_custom_reduction,
+                reduction_start_year=self.params.ss_reduction_start_year,
+                start_age=self.params.ss_start_age
+            )
+
+        # Spousal Social Security
+        if self.params.spouse_ss_enabled:
+            total_ss_income += calculate_social_security_benefits(
+                years=years,
+                start_year=self.params.start_year,
+                retirement_age=self.params.retirement_age,
+                annual_benefit=self.params.spouse_ss_annual_benefit,
+                scenario=self.params.ss_benefit_scenario,  # Use same scenario
+                custom_reduction=self.params.ss_custom_reduction,  # Use same reduction
+                reduction_start_year=self.params.ss_reduction_start_year,
+                start_age=self.params.spouse_ss_start_age
+            )
+
+        return total_ss_income
     
     def _apply_spending_guardrails(self, current_base_spend: float,
                                  portfolio_value: float) -> Tuple[float, str]:
@@ -478,6 +545,12 @@ class RetirementSimulator:
         else:
             initial_base_spend = self._get_base_withdrawal_rate() * self.params.start_capital
         
+        # Social Security and expense streams do not vary between paths, so
+        # compute them once per year
+        ss_income_by_year = self._get_social_security_income_by_year().tolist()
+        one_times_by_year = self._get_onetime_expenses_by_year().tolist()
+        other_income_by_year = self._get_other_income_by_year().tolist()
+        
         for sim in range(self.params.num_sims):
             portfolio_value = self.params.start_capital
             current_base_spend = initial_base_spend
@@ -515,13 +588,13 @@ class RetirementSimulator:
                 
                 # Add other spending components
                 college_topup = self._get_college_topup(current_year)
-                one_times = self._get_onetime_expense(current_year)
+                one_times = one_times_by_year[year_idx]
                 total_spending_need = final_base_spend + college_topup + one_times
                 
                 # Subtract non-portfolio income
                 re_income = self._get_re_income(current_year)
-                other_income = self._get_other_income(current_year)
-                ss_income = self._get_social_security_income(current_year)
+                other_income = other_income_by_year[year_idx]
+                ss_income = ss_income_by_year[year_idx]
                 net_need = total_spending_need - re_income - other_income - ss_income
                 
                 # Calculate gross withdrawal with taxes
@@ -630,9 +703,8 @@ class RetirementSimulator:
 
 def calculate_percentiles(wealth_paths: np.ndarray) -> Dict[str, np.ndarray]:
     """Calculate wealth percentile bands over time"""
-    p10 = np.percentile(wealth_paths, 10, axis=0)
-    p50 = np.percentile(wealth_paths, 50, axis=0)
-    p90 = np.percentile(wealth_paths, 90, axis=0)
+    # One call selects all three ranks in a single partition of each column
+    p10, p50, p90 = np.percentile(wealth_paths, [10, 50, 90], axis=0)
     
     return {
         'p10': p10,
@@ -643,11 +715,12 @@ def calculate_percentiles(wealth_paths: np.ndarray) -> Dict[str, np.ndarray]:
 
 def calculate_summary_stats(terminal_wealth: np.ndarray) -> Dict[str, float]:
     """Calculate summary statistics for terminal wealth"""
+    p10, p50, p90 = np.percentile(terminal_wealth, [10, 50, 90])
     return {
         'mean': np.mean(terminal_wealth),
-        'p10': np.percentile(terminal_wealth, 10),
-        'p50': np.percentile(terminal_wealth, 50),
-        'p90': np.percentile(terminal_wealth, 90),
+        'p10': p10,
+        'p50': p50,
+        'p90': p90,
         'prob_below_5m': np.mean(terminal_wealth < 5_000_000),
         'prob_below_10m': np.mean(terminal_wealth < 10_000_000),
         'prob_below_15m': np.mean(terminal_wealth < 15_000_000)
@@ -6,6 +6,41 @@ from typing import List, Tuple
 import numpy as np
 
 
+def _prepare_brackets(tax_brackets: List[Tuple[float, float]]) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Sort brackets by threshold and pair each with its upper limit.
+    
+    Args:
+        tax_brackets: List of (threshold, rate) tuples where threshold is the START of each bracket
+        
+    Returns:
+        Tuple of (threshold, upper_limit, rate), the highest bracket unbounded
+    """
+    sorted_brackets = sorted(tax_brackets, key=lambda x: x[0])
+    upper_limits = [bracket[0] for bracket in sorted_brackets[1:]] + [float('inf')]
+    return tuple((threshold, upper_limit, rate)
+                 for (threshold, rate), upper_limit in zip(sorted_brackets, upper_limits))
+
+
+def _tax_from_prepared(taxable_income: float,
+                       prepared_brackets: Tuple[Tuple[float, float, float], ...]) -> float:
+    """Progressive tax on taxable_income using brackets from _prepare_brackets"""
+    if taxable_income <= 0:
+        return 0.0
+    
+    tax = 0.0
+    for threshold, upper_limit, rate in prepared_brackets:
+        # Brackets are sorted, so no income reaches this one or any above it
+        if taxable_income <= threshold:
+            break
+        
+        # Calculate income taxed in this bracket
+        income_in_bracket = (taxable_income if taxable_income < upper_limit else upper_limit) - threshold
+        tax += income_in_bracket * rate
+    
+    return max(0.0, tax)
+
+
 def calculate_tax(taxable_income: float, tax_brackets: List[Tuple[float, float]]) -> float:
     """
     Calculate tax using progressive brackets.
@@ -23,25 +58,7 @@ def calculate_tax(taxable_income: float, tax_brackets: List[Tuple[float, float]]
     if not tax_brackets:
         return 0.0
     
-    tax = 0.0
-    
-    # Sort brackets by threshold to ensure proper order
-    sorted_brackets = sorted(tax_brackets, key=lambda x: x[0])
-    
-    for i, (threshold, rate) in enumerate(sorted_brackets):
-        # Calculate the upper limit of this bracket
-        if i + 1 < len(sorted_brackets):
-            upper_limit = sorted_brackets[i + 1][0]
-        else:
-            upper_limit = float('inf')  # No upper limit for highest bracket
-        
-        # Calculate income taxed in this bracket
-        income_in_bracket = max(0, min(taxable_income, upper_limit) - threshold)
-        
-        if income_in_bracket > 0:
-            tax += income_in_bracket * rate
-    
-    return max(0.0, tax)
+    return _tax_from_prepared(taxable_income, _prepare_brackets(tax_brackets))
 
 
 def solve_gross_withdrawal(net_need: float, 
@@ -69,11 +86,14 @@ def solve_gross_withdrawal(net_need: float,
     if net_need <= 0:
         return 0.0, 0.0
     
+    # Sort the brackets once; the bisection below evaluates the tax many times
+    prepared_brackets = _prepare_brackets(tax_brackets) if tax_brackets else ()
+    
     def tax_function(W: float) -> float:
         """Calculate taxes on total AGI"""
         agi = W + other_taxable_income
         taxable_income = max(0.0, agi - standard_deduction)
-        return calculate_tax(taxable_income, tax_brackets)
+        return _tax_from_prepared(taxable_income, prepared_brackets)
     
     def net_function(W: float) -> float:
         """Calculate net amount after taxes"""
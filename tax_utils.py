@@ -3,53 +3,57 @@ Tax and Social Security utility functions
 Extracted from legacy app.py to prevent import conflicts in multipage app
 """
 
-def get_state_tax_rates(state, filing_status):
-    """Get combined federal + state tax rates for common states"""
-    # These are rough estimates combining federal and state effective rates
-    state_rates = {
-        'Federal Only': {
-            'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
-            'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
-        },
-        'CA': {  # High state tax
-            'MFJ': [(0, 0.13), (94_300, 0.31), (201_000, 0.36)],
-            'Single': [(0, 0.13), (47_150, 0.31), (100_500, 0.36)]
-        },
-        'NY': {  # High state tax
-            'MFJ': [(0, 0.14), (94_300, 0.30), (201_000, 0.35)],
-            'Single': [(0, 0.14), (47_150, 0.30), (100_500, 0.35)]
-        },
-        'TX': {  # No state income tax
-            'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
-            'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
-        },
-        'FL': {  # No state income tax
-            'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
-            'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
-        },
-        'WA': {  # No state income tax
-            'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
-            'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
-        },
-        'NV': {  # No state income tax
-            'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
-            'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
-        },
-        'PA': {  # Flat state tax
-            'MFJ': [(0, 0.13), (94_300, 0.25), (201_000, 0.27)],
-            'Single': [(0, 0.13), (47_150, 0.25), (100_500, 0.27)]
-        },
-        'OH': {  # Moderate state tax
-            'MFJ': [(0, 0.12), (94_300, 0.26), (201_000, 0.29)],
-            'Single': [(0, 0.12), (47_150, 0.26), (100_500, 0.29)]
-        },
-        'IL': {  # Moderate state tax
-            'MFJ': [(0, 0.12), (94_300, 0.27), (201_000, 0.30)],
-            'Single': [(0, 0.12), (47_150, 0.27), (100_500, 0.30)]
-        }
+import numpy as np
+
+# Rough estimates combining federal and state effective rates, built once at import
+_STATE_TAX_RATES = {
+    'Federal Only': {
+        'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
+        'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
+    },
+    'CA': {  # High state tax
+        'MFJ': [(0, 0.13), (94_300, 0.31), (201_000, 0.36)],
+        'Single': [(0, 0.13), (47_150, 0.31), (100_500, 0.36)]
+    },
+    'NY': {  # High state tax
+        'MFJ': [(0, 0.14), (94_300, 0.30), (201_000, 0.35)],
+        'Single': [(0, 0.14), (47_150, 0.30), (100_500, 0.35)]
+    },
+    'TX': {  # No state income tax
+        'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
+        'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
+    },
+    'FL': {  # No state income tax
+        'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
+        'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
+    },
+    'WA': {  # No state income tax
+        'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
+        'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
+    },
+    'NV': {  # No state income tax
+        'MFJ': [(0, 0.10), (94_300, 0.22), (201_000, 0.24)],
+        'Single': [(0, 0.10), (47_150, 0.22), (100_500, 0.24)]
+    },
+    'PA': {  # Flat state tax
+        'MFJ': [(0, 0.13), (94_300, 0.25), (201_000, 0.27)],
+        'Single': [(0, 0.13), (47_150, 0.25), (100_500, 0.27)]
+    },
+    'OH': {  # Moderate state tax
+        'MFJ': [(0, 0.12), (94_300, 0.26), (201_000, 0.29)],
+        'Single': [(0, 0.12), (47_150, 0.26), (100_500, 0.29)]
+    },
+    'IL': {  # Moderate state tax
+        'MFJ': [(0, 0.12), (94_300, 0.27), (201_000, 0.30)],
+        'Single': [(0, 0.12), (47_150, 0.27), (100_500, 0.30)]
     }
+}
 
-    return state_rates.get(state, state_rates['Federal Only'])[filing_status]
+
+def get_state_tax_rates(state, filing_status):
+    """Get combined federal + state tax rates for common states"""
+    # Copy the bracket list so callers can edit it without touching the table
+    return list(_STATE_TAX_RATES.get(state, _STATE_TAX_RATES['Federal Only'])[filing_status])
 
 
 def calculate_social_security_benefit(year, start_year, retirement_age, annual_benefit, scenario, custom_reduction, reduction_start_year, start_age):
@@ -83,4 +87,30 @@ def calculate_social_security_benefit(year, start_year, retirement_age, annual_b
     else:
         reduction = 0.0
 
-    return base_benefit * (1 - reduction)
\ No newline at end of file
+    return base_benefit * (1 - reduction)
+
+
+def calculate_social_security_benefits(years, start_year, retirement_age, annual_benefit, scenario, custom_reduction, reduction_start_year, start_age):
+    """
+    Vectorized calculate_social_security_benefit over an array of years.
+
+    Returns a float array with the same benefit calculate_social_security_benefit
+    gives for each year, computed with a few NumPy operations instead of one
+    Python call per year.
+    """
+    years = np.asarray(years)
+    age_at_year = retirement_age + (years - start_year)
+
+    # Scenario reduction, applied only from reduction_start_year on
+    if scenario == 'conservative':
+        reduction = np.full(years.shape, 0.19)
+    elif scenario == 'moderate':
+        reduction = np.minimum(0.10, 0.05 + (years - reduction_start_year) * 0.01)
+    elif scenario == 'custom':
+        reduction = np.full(years.shape, float(custom_reduction))
+    else:
+        reduction = np.zeros(years.shape)
+    reduction = np.where(years >= reduction_start_year, reduction, 0.0)
+
+    # No benefit before the start age
+    return np.where(age_at_year >= start_age, annual_benefit * (1 - reduction), 0.0)
@@ -2,7 +2,10 @@
 Unit tests for tax_utils.py helper functions (state tax and Social Security).
 """
 import pytest
-from tax_utils import get_state_tax_rates, calculate_social_security_benefit
+import numpy as np
+from tax_utils import (
+    get_state_tax_rates, calculate_social_security_benefit, calculate_social_security_benefits
+)
 
 
 class TestStateTaxRates:
@@ -72,6 +75,14 @@ class TestStateTaxRates:
                 assert isinstance(rate, float)
                 assert 0 <= rate <= 0.5
 
+    def test_returned_brackets_are_independent_copies(self):
+        """Test editing returned brackets does not change later lookups"""
+        rates = get_state_tax_rates('CA', 'MFJ')
+        rates.append((500_000, 0.40))
+        rates[0] = (0, 0.0)
+
+        assert get_state_tax_rates('CA', 'MFJ') == [(0, 0.13), (94_300, 0.31), (201_000, 0.36)]
+
 
 class TestSocialSecurityBenefit:
     """Test Social Security benefit calculation"""
@@ -243,4 +254,17 @@ class TestSocialSecurityBenefit:
             reduction_start_year=2034, start_age=67
         )
         expected = 40000 * (1 - 0.5)
-        assert abs(benefit - expected) < 0.01
\ No newline at end of file
+        assert abs(benefit - expected) < 0.01
+
+    @pytest.mark.parametrize('scenario', ['conservative', 'moderate', 'optimistic', 'custom'])
+    def test_vectorized_benefits_match_scalar(self, scenario):
+        """Test the array version gives the scalar benefit for every year"""
+        years = np.arange(2026, 2076)
+        kwargs = dict(start_year=2026, retirement_age=62, annual_benefit=40000,
+                      scenario=scenario, custom_reduction=0.23,
+                      reduction_start_year=2034, start_age=67)
+
+        benefits = calculate_social_security_benefits(years, **kwargs)
+
+        expected = [calculate_social_security_benefit(year=int(year), **kwargs) for year in years]
+        assert benefits.tolist() == expected
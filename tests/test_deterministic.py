@@ -232,6 +232,20 @@ class TestDeterministicProjector:
         for i in range(len(details['taxes'])):
             assert details['taxes'][i] <= details['gross_withdrawal'][i]
 
+    def test_run_cached_reuses_results(self):
+        """Test that cached projection is reused only for identical params"""
+        params = SimulationParams(horizon_years=5, start_capital=1_000_000)
+        first = DeterministicProjector(params).run_cached()
+        second = DeterministicProjector(SimulationParams(horizon_years=5, start_capital=1_000_000)).run_cached()
+
+        assert second is first
+        np.testing.assert_array_equal(first.wealth_path,
+                                      DeterministicProjector(params).run_projection().wealth_path)
+
+        changed = DeterministicProjector(SimulationParams(horizon_years=5, start_capital=2_000_000)).run_cached()
+        assert changed is not first
+        assert changed.wealth_path[0] == 2_000_000
+
 
 class TestNominalConversion:
     """Test nominal dollar conversion utilities"""
@@ -6,12 +6,14 @@ import json
 import numpy as np
 import pandas as pd
 from io import StringIO
+from dataclasses import asdict
 from simulation import SimulationParams, SimulationResults
 from io_utils import (
     params_to_dict, dict_to_params, create_parameters_download_json,
     parse_parameters_upload_json, export_terminal_wealth_csv,
     export_percentile_bands_csv, export_year_by_year_csv,
-    validate_parameters_json, format_currency
+    validate_parameters_json, parse_parameters_json, format_currency, create_summary_report,
+    create_batch_export_zip, export_summary_report_json
 )
 
 
@@ -36,6 +38,23 @@ class TestParameterSerialization:
         assert param_dict['filing_status'] == "Single"
         assert isinstance(param_dict, dict)
     
+    def test_params_to_dict_copies_lists(self):
+        """Test that list fields are copied, not shared with the params object"""
+        params = SimulationParams(
+            expense_streams=[{'start_year': 2030, 'years': 2, 'amount': 10_000}],
+            income_streams=[{'start_year': 2026, 'years': 5, 'amount': 20_000}]
+        )
+
+        param_dict = params_to_dict(params)
+        param_dict['expense_streams'][0]['amount'] = 0
+        param_dict['income_streams'].append({'start_year': 2040, 'years': 1, 'amount': 1})
+        param_dict['tax_brackets'].append((500_000, 0.35))
+
+        assert param_dict == asdict(SimulationParams(**param_dict))
+        assert params.expense_streams[0]['amount'] == 10_000
+        assert len(params.income_streams) == 1
+        assert len(params.tax_brackets) == 3
+    
     def test_dict_to_params_basic(self):
         """Test converting dictionary to params"""
         param_dict = {
@@ -160,6 +179,26 @@ class TestParameterSerialization:
         assert restored_params.ss_custom_reduction == 0.10
         assert restored_params.ss_reduction_start_year == 2034
 
+    def test_wizard_inheritance_stream_split_from_expenses(self):
+        """Test the first inheritance expense stream becomes inherit_amount/year"""
+        wizard_json = {
+            'basic_params': {},
+            'allocation': {},
+            'cash_flows': {'expense_streams': [
+                {'amount': 15_000, 'start_year': 2030, 'duration': 3, 'description': 'Car'},
+                {'amount': -500_000, 'start_year': 2045, 'description': 'Parents Inheritance'},
+                {'amount': -100_000, 'start_year': 2050, 'description': 'inheritance (aunt)'},
+            ]}
+        }
+
+        params = parse_parameters_upload_json(json.dumps(wizard_json))
+
+        assert params.inherit_amount == 500_000
+        assert params.inherit_year == 2045
+        assert params.expense_streams == [
+            {'amount': 15_000, 'start_year': 2030, 'duration': 3, 'description': 'Car'}
+        ]
+
 
 class TestCSVExports:
     """Test CSV export functionality"""
@@ -177,6 +216,35 @@ class TestCSVExports:
         assert df['simulation'].tolist() == [1, 2, 3]
         assert df['terminal_wealth'].tolist() == [1_000_000, 2_000_000, 3_000_000]
     
+    def test_terminal_wealth_csv_exact_text(self):
+        """Test terminal wealth keeps full float precision like DataFrame.to_csv"""
+        terminal_wealth = np.array([4.123456789, 0.1, 10_000_000.0, -3.0, np.nan])
+
+        csv_str = export_terminal_wealth_csv(terminal_wealth)
+
+        assert csv_str == (
+            "simulation,terminal_wealth\n"
+            "1,4.123456789\n2,0.1\n3,10000000.0\n4,-3.0\n5,\n"
+        )
+        assert csv_str == pd.DataFrame({
+            'simulation': range(1, 6), 'terminal_wealth': terminal_wealth
+        }).to_csv(index=False)
+        # Integer input stays integer, as with the DataFrame export
+        assert export_terminal_wealth_csv(np.array([10_000_000, -3])) == (
+            "simulation,terminal_wealth\n1,10000000\n2,-3\n"
+        )
+    
+    def test_terminal_wealth_csv_matches_pandas_across_chunks(self):
+        """Test rows formatted in separate blocks still match DataFrame.to_csv"""
+        from io_utils import _CSV_CHUNK_ROWS
+
+        terminal_wealth = np.random.default_rng(0).lognormal(15, 1, 2 * _CSV_CHUNK_ROWS + 7)
+        terminal_wealth[::1000] = np.nan
+
+        assert export_terminal_wealth_csv(terminal_wealth) == pd.DataFrame({
+            'simulation': range(1, len(terminal_wealth) + 1), 'terminal_wealth': terminal_wealth
+        }).to_csv(index=False)
+
     def test_percentile_bands_csv_real(self):
         """Test percentile bands CSV export (real)"""
         years = np.array([2026, 2027, 2028])
@@ -209,6 +277,29 @@ class TestCSVExports:
         expected_cols = ['year', 'p10_wealth_nominal', 'p50_wealth_nominal', 'p90_wealth_nominal']
         assert list(df.columns) == expected_cols
     
+    def test_percentile_bands_csv_exact_text(self):
+        """Test percentile bands are formatted like DataFrame.to_csv"""
+        years = np.array([2026, 2027])
+        percentiles = {
+            'p10': np.array([1.5, 2_000_000.0]),
+            'p50': np.array([3.0, 0.1]),
+            'p90': np.array([5.0, 4.123456789])
+        }
+
+        csv_str = export_percentile_bands_csv(years, percentiles, "real")
+
+        assert csv_str == (
+            "year,p10_wealth_real,p50_wealth_real,p90_wealth_real\n"
+            "2026,1.5,3.0,5.0\n"
+            "2027,2000000.0,0.1,4.123456789\n"
+        )
+        assert csv_str == pd.DataFrame({
+            'year': years,
+            'p10_wealth_real': percentiles['p10'],
+            'p50_wealth_real': percentiles['p50'],
+            'p90_wealth_real': percentiles['p90']
+        }).to_csv(index=False)
+
     def test_year_by_year_csv(self):
         """Test year-by-year details CSV export"""
         details = {
@@ -237,6 +328,148 @@ class TestCSVExports:
         assert len(df) == 2
         assert df['years'].tolist() == [2026, 2027]
 
+    def test_year_by_year_csv_exact_text(self):
+        """Test booleans, labels and whole floats keep DataFrame.to_csv formatting"""
+        details = {
+            'years': [2026, 2027],
+            'start_assets': [8_000_000.0, 7_550_000.0],
+            'taxes': [50_000.5, 0.1],
+            'floor_applied': [False, True],
+            'guardrail_action': ['none', 'up, then hold']
+        }
+
+        csv_str = export_year_by_year_csv(details, "real")
+
+        assert csv_str == (
+            "years,start_assets_real,taxes_real,floor_applied,guardrail_action\n"
+            "2026,8000000.0,50000.5,False,none\n"
+            "2027,7550000.0,0.1,True,\"up, then hold\"\n"
+        )
+        # Whole-number currency columns are not forced to float
+        assert export_year_by_year_csv({'years': [2026], 'taxes': [50_000]}, "real") == (
+            "years,taxes_real\n2026,50000\n"
+        )
+
+
+class TestSummaryReport:
+    """Test summary report statistics"""
+
+    def _make_results(self, terminal_wealth):
+        n = len(terminal_wealth)
+        return SimulationResults(
+            terminal_wealth=np.asarray(terminal_wealth, dtype=float),
+            wealth_paths=np.zeros((n, 2)),
+            guardrail_hits=np.array([0, 1, 2, 0, 3, 0][:n]),
+            years_depleted=np.array([0, 0, 12, 0, 20, 0][:n]),
+            success_rate=0.5,
+            median_path_details={},
+            p10_path_details={},
+            p90_path_details={}
+        )
+
+    def test_terminal_stats_match_numpy(self):
+        """Test terminal wealth statistics match direct NumPy reductions"""
+        terminal_wealth = np.array([3_000_000, 0, 12_000_000, 800_000, 5_000_000, 20_000_000])
+        report = create_summary_report(SimulationParams(), self._make_results(terminal_wealth))
+        stats = report['terminal_wealth_stats']
+
+        assert stats['mean'] == pytest.approx(np.mean(terminal_wealth))
+        assert stats['median'] == pytest.approx(np.median(terminal_wealth))
+        assert stats['std'] == pytest.approx(np.std(terminal_wealth))
+        assert stats['p10'] == pytest.approx(np.percentile(terminal_wealth, 10))
+        assert stats['p90'] == pytest.approx(np.percentile(terminal_wealth, 90))
+        assert stats['min'] == 0
+        assert stats['max'] == 20_000_000
+
+    def test_probability_thresholds_boundaries(self):
+        """Test zero threshold is inclusive and dollar thresholds are strict"""
+        terminal_wealth = np.array([3_000_000, 0, 12_000_000, 800_000, 5_000_000, 1_000_000])
+        report = create_summary_report(SimulationParams(), self._make_results(terminal_wealth))
+        probs = report['probability_analysis']
+
+        assert probs['prob_below_0'] == pytest.approx(1 / 6)
+        assert probs['prob_below_1m'] == pytest.approx(2 / 6)
+        assert probs['prob_below_5m'] == pytest.approx(4 / 6)
+        assert probs['prob_below_10m'] == pytest.approx(5 / 6)
+        assert probs['prob_below_15m'] == pytest.approx(1.0)
+
+    def test_summary_report_json_numeric_values(self):
+        """Test report statistics are Python scalars that serialize as JSON numbers"""
+        terminal_wealth = np.array([3_000_000, 0, 12_000_000, 800_000, 5_000_000, 20_000_000])
+        report = create_summary_report(SimulationParams(), self._make_results(terminal_wealth))
+
+        parsed = json.loads(export_summary_report_json(report))
+
+        assert all(type(value) is float for value in report['terminal_wealth_stats'].values())
+        assert parsed['terminal_wealth_stats']['max'] == 20_000_000
+        assert isinstance(parsed['guardrail_analysis']['max_hits'], int)
+        assert parsed['depletion_analysis']['avg_years_to_depletion'] == pytest.approx(16.0)
+
+
+class TestBatchExport:
+    """Test ZIP batch export"""
+
+    def test_batch_zip_entries_match_string_exports(self):
+        """Test streamed ZIP entries are identical to the string exports"""
+        import zipfile
+
+        params = SimulationParams(num_sims=3, horizon_years=2)
+        results = SimulationResults(
+            terminal_wealth=np.array([1_000_000.0, 2_500_000.0, 0.0]),
+            wealth_paths=np.zeros((3, 3)),
+            guardrail_hits=np.array([0, 1, 2]),
+            years_depleted=np.array([0, 0, 2]),
+            success_rate=2 / 3,
+            median_path_details={'years': [2026, 2027], 'start_assets': [8_000_000, 7_500_000]},
+            p10_path_details={},
+            p90_path_details={}
+        )
+        years = np.array([2026, 2027, 2028])
+        percentiles = {
+            'p10': np.array([1.0, 2.0, 3.0]),
+            'p50': np.array([4.0, 5.0, 6.0]),
+            'p90': np.array([7.0, 8.0, 9.0])
+        }
+
+        zip_buffer = create_batch_export_zip(params, results, percentiles, years)
+        with zipfile.ZipFile(zip_buffer) as zip_file:
+            assert zip_file.read('terminal_wealth.csv').decode() == \
+                export_terminal_wealth_csv(results.terminal_wealth)
+            assert zip_file.read('percentile_bands_real.csv').decode() == \
+                export_percentile_bands_csv(years, percentiles, "real")
+            assert zip_file.read('year_by_year_real.csv').decode() == \
+                export_year_by_year_csv(results.median_path_details, "real")
+            assert json.loads(zip_file.read('parameters.json'))['num_sims'] == 3
+            assert 'terminal_wealth_stats' in json.loads(zip_file.read('summary_report.json'))
+            # Small JSON entries are stored, CSVs are deflated
+            assert zip_file.getinfo('parameters.json').compress_type == zipfile.ZIP_STORED
+            assert zip_file.getinfo('terminal_wealth.csv').compress_type == zipfile.ZIP_DEFLATED
+
+    def test_large_csv_streams_into_text_wrapper(self):
+        """Test a large CSV written block by block through a TextIOWrapper keeps its bytes"""
+        import io
+        from io_utils import _CSV_CHUNK_ROWS
+
+        terminal_wealth = np.random.default_rng(1).lognormal(15, 1, 5 * _CSV_CHUNK_ROWS + 11)
+        expected = export_terminal_wealth_csv(terminal_wealth)
+
+        class RecordingBytesIO(io.BytesIO):
+            """Byte sink that remembers its largest single write"""
+            largest_write = 0
+
+            def write(self, data):
+                self.largest_write = max(self.largest_write, len(data))
+                return super().write(data)
+
+        raw = RecordingBytesIO()
+        entry = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+        assert export_terminal_wealth_csv(terminal_wealth, buf=entry) is None
+        entry.flush()
+
+        assert raw.getvalue() == expected.encode('utf-8')
+        # The CSV reaches the byte stream in pieces, never as one whole string
+        assert raw.largest_write < len(expected) // 2
+
 
 class TestParameterValidation:
     """Test parameter validation"""
@@ -258,6 +491,24 @@ class TestParameterValidation:
         
         assert is_valid == True
         assert error == ""
+        
+        is_valid, error, params = parse_parameters_json(json_str)
+        
+        assert is_valid == True
+        assert isinstance(params, SimulationParams)
+        assert params.start_capital == valid_params['start_capital']
+    
+    def test_non_object_json(self):
+        """Test validation of JSON that is not an object"""
+        is_valid, error = validate_parameters_json('[]')
+        
+        assert is_valid == False
+        assert "must be an object" in error
+        
+        is_valid, error, params = parse_parameters_json('[]')
+        
+        assert is_valid == False
+        assert params is None
     
     def test_invalid_json(self):
         """Test validation of invalid JSON"""
@@ -268,6 +519,17 @@ class TestParameterValidation:
         assert is_valid == False
         assert "Invalid JSON" in error
     
+    def test_oversized_json_rejected_before_parsing(self):
+        """Test that oversized uploads are rejected without being parsed"""
+        from io_utils import MAX_PARAMETERS_JSON_SIZE
+
+        oversized = '{"padding": "' + 'x' * MAX_PARAMETERS_JSON_SIZE + '"}'
+
+        is_valid, error = validate_parameters_json(oversized)
+
+        assert is_valid == False
+        assert "too large" in error
+    
     def test_missing_required_field(self):
         """Test validation with missing required field"""
         incomplete_params = {
@@ -163,6 +163,23 @@ class TestRetirementSimulator:
         assert simulator._get_onetime_expense(2036) == 50_000  # Kid 2 only
         assert simulator._get_onetime_expense(2037) == 50_000  # Kid 2 only
         assert simulator._get_onetime_expense(2038) == 0       # Neither
+
+    def test_expenses_by_year_match_per_year_lookup(self):
+        """Test the precomputed expense table matches the per-year lookup"""
+        params = SimulationParams(
+            start_year=2030,
+            horizon_years=12,
+            expense_streams=[
+                {'amount': 50_000, 'start_year': 2032, 'years': 4, 'description': 'Kid 1 college'},
+                {'amount': 50_000, 'start_year': 2034, 'years': 4, 'description': 'Kid 2 college'},
+                {'year': 2040, 'amount': 12_500.5, 'description': 'Legacy one-time'}
+            ]
+        )
+        simulator = RetirementSimulator(params)
+
+        by_year = simulator._get_onetime_expenses_by_year()
+
+        assert by_year.tolist() == [simulator._get_onetime_expense(2030 + i) for i in range(12)]
     
     def test_other_income(self):
         """Test other income calculation"""
@@ -178,6 +195,48 @@ class TestRetirementSimulator:
         assert simulator._get_other_income(2034) == 50_000
         assert simulator._get_other_income(2035) == 0
     
+    def test_other_income_by_year_match_per_year_lookup(self):
+        """Test the precomputed income table matches the per-year lookup"""
+        params = SimulationParams(
+            start_year=2030,
+            horizon_years=15,
+            income_streams=[
+                {'amount': 20_000, 'start_year': 2031, 'years': 5, 'description': 'Consulting'},
+                {'amount': 7_500.25, 'start_year': 2034, 'years': 10, 'description': 'Rental'}
+            ]
+        )
+        simulator = RetirementSimulator(params)
+        by_year = simulator._get_other_income_by_year()
+        assert by_year.tolist() == [simulator._get_other_income(2030 + i) for i in range(15)]
+
+        legacy = RetirementSimulator(SimulationParams(
+            start_year=2028, horizon_years=10,
+            other_income_amount=50_000, other_income_start_year=2030, other_income_years=5
+        ))
+        assert legacy._get_other_income_by_year().tolist() == [legacy._get_other_income(2028 + i) for i in range(10)]
+
+    def test_other_income_by_year_fractional_duration(self):
+        """Test fractional stream start/years are not truncated in the income table"""
+        params = SimulationParams(
+            start_year=2030,
+            horizon_years=8,
+            income_streams=[
+                {'amount': 20_000, 'start_year': 2031, 'years': 2.5, 'description': 'Consulting'},
+                {'amount': 5_000, 'start_year': 2032.5, 'years': 3, 'description': 'Rental'}
+            ]
+        )
+        simulator = RetirementSimulator(params)
+        by_year = simulator._get_other_income_by_year()
+        assert by_year.tolist() == [simulator._get_other_income(2030 + i) for i in range(8)]
+        # 2.5 years from 2031 covers 2031-2033; the stream starting mid-2032 pays from 2033
+        assert by_year.tolist() == [0, 20_000, 20_000, 25_000, 5_000, 5_000, 0, 0]
+
+        legacy = RetirementSimulator(SimulationParams(
+            start_year=2028, horizon_years=6,
+            other_income_amount=50_000, other_income_start_year=2030, other_income_years=1.5
+        ))
+        assert legacy._get_other_income_by_year().tolist() == [legacy._get_other_income(2028 + i) for i in range(6)]
+
     def test_spending_guardrails(self):
         """Test Guyton-Klinger guardrails"""
         # Use correct logic: lower_wr (5%) > upper_wr (3%)
@@ -348,6 +407,18 @@ class TestUtilityFunctions:
         assert percentiles['p50'][2] == 130  # P50 should be median (middle value)
         assert 140 <= percentiles['p90'][2] <= 150  # P90 should be between 4th and max value
     
+    def test_percentile_bands_match_single_percentile_calls(self):
+        """Test the combined percentile call matches separate np.percentile calls"""
+        rng = np.random.default_rng(7)
+        wealth_paths = rng.lognormal(14, 1, size=(1001, 12))
+
+        percentiles = calculate_percentiles(wealth_paths)
+        stats = calculate_summary_stats(wealth_paths[:, -1])
+
+        for q in (10, 50, 90):
+            np.testing.assert_array_equal(percentiles[f'p{q}'], np.percentile(wealth_paths, q, axis=0))
+            assert stats[f'p{q}'] == np.percentile(wealth_paths[:, -1], q)
+    
     def test_calculate_summary_stats(self):
         """Test summary statistics calculation"""
         terminal_wealth = np.array([5_000_000, 8_000_000, 12_000_000, 15_000_000, 20_000_000])
@@ -88,6 +88,14 @@ class TestCalculateTax:
         expected = 100_000 * 0.15
         assert abs(tax - expected) < 1e-6
 
+    def test_unsorted_brackets_match_sorted(self):
+        """Test bracket order does not change the tax"""
+        brackets = [(0, 0.10), (50_000, 0.20), (100_000, 0.30)]
+        shuffled = [brackets[2], brackets[0], brackets[1]]
+
+        for income in (0, 25_000, 50_000, 75_000, 100_000, 250_000):
+            assert calculate_tax(income, shuffled) == calculate_tax(income, brackets)
+
 
 class TestSolveGrossWithdrawal:
     """Test gross withdrawal solver"""
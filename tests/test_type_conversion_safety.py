@@ -17,6 +17,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from pages.wizard import convert_wizard_to_json
 from io_utils import convert_wizard_json_to_simulation_params, dict_to_params
 from simulation import SimulationParams
+from pages.monte_carlo import _stream_editor_rows, _streams_from_editor_rows
 
 
 class TestTypeConversionSafety:
@@ -277,5 +278,29 @@ class TestParameterPipelineIntegrity:
         assert total_ss == 60500  # Mathematical integrity preserved
 
 
+class TestStreamEditorRows:
+    """Test the expense/income stream table conversions"""
+
+    def test_round_trip_preserves_streams(self):
+        """Test streams survive the editor row conversion unchanged"""
+        streams = [
+            {'amount': 75_000, 'start_year': 2030, 'years': 1, 'description': 'Home renovation'},
+            {'amount': 12_500.5, 'start_year': 2032, 'years': 4, 'description': 'Tuition'}
+        ]
+        defaults = {'amount': 50_000, 'start_year': 2030, 'years': 1}
+        rows = _stream_editor_rows(streams, 'Expense stream')
+        assert _streams_from_editor_rows(rows, defaults, 'Expense stream') == streams
+
+    def test_legacy_year_key_and_blank_added_row(self):
+        """Test legacy 'year' streams and blank added rows get usable values"""
+        rows = _stream_editor_rows([{'year': 2040, 'amount': 60_000}], 'Expense stream')
+        assert rows[0]['start_year'] == 2040
+        rows.append({'amount': float('nan'), 'start_year': None, 'years': 3.0, 'description': None})
+        defaults = {'amount': 50_000, 'start_year': 2030, 'years': 1}
+        streams = _streams_from_editor_rows(rows, defaults, 'Expense stream')
+        assert streams[1] == {'amount': 50_000, 'start_year': 2030, 'years': 3, 'description': 'Expense stream 2'}
+        assert all(isinstance(stream['years'], int) for stream in streams)
+
+
 if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
\ No newline at end of file
+    pytest.main([__file__, '-v'])